@@ -465,9 +465,7 @@ def plot_stop():
     # Send end G-code
     end_gcode = plotter_settings.get('end_gcode')
     if end_gcode:
-        for line in end_gcode.split('\n'):
-            if line.strip():
-                serial_handler.send_command(line.strip())
+        serial_handler.send_many(end_gcode.split('\n'))
     
     return jsonify({'success': True})
 
@@ -67,12 +67,14 @@ class FileHandler:
         
         for layer in turtle.layers:
             for line in layer.lines:
-                if len(line.points) < 2:
+                if len(line) < 2:
                     continue
                 
+                points = line.points
+                
                 # Build path data (flip Y for SVG coordinates)
-                d = f"M {line.points[0].x} {-line.points[0].y}"
-                for point in line.points[1:]:
+                d = f"M {points[0].x} {-points[0].y}"
+                for point in points[1:]:
                     d += f" L {point.x} {-point.y}"
                 
                 svg_parts.append(
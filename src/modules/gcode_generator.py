@@ -16,13 +16,15 @@ class GCodeGenerator:
     def turtle_to_gcode(self, turtle: Turtle) -> List[str]:
         """Convert a Turtle's paths to G-code."""
         gcode = []
+        feed_travel = self.settings.feed_rate_travel
+        feed_draw = self.settings.feed_rate_draw
         
         # Header
         gcode.append('; Generated by Polargraph Web Interface')
         gcode.append('; Makelangelo-compatible G-code')
         gcode.append('')
         gcode.append('G90 ; Absolute positioning')
-        gcode.append(f'G0 F{self.settings.get("feed_rate_travel")} ; Set travel speed')
+        gcode.append(f'G0 F{feed_travel} ; Set travel speed')
         
         # Pen up to start
         gcode.append(self.settings.get_pen_up_command())
@@ -32,11 +34,13 @@ class GCodeGenerator:
         
         for layer in turtle.layers:
             for line in layer.lines:
-                if len(line.points) < 2:
+                if len(line) < 2:
                     continue
                 
+                points = line.points
+                
                 # Move to start of line (travel move)
-                start = line.points[0]
+                start = points[0]
                 
                 if last_point is None or self._distance(last_point, start) > 0.1:
                     # Pen up if not already
@@ -45,7 +49,7 @@ class GCodeGenerator:
                         pen_is_up = True
                     
                     # Travel to start
-                    gcode.append(f'G0 X{start.x:.3f} Y{start.y:.3f} F{self.settings.get("feed_rate_travel")}')
+                    gcode.append(f'G0 X{start.x:.3f} Y{start.y:.3f} F{feed_travel}')
                 
                 # Pen down
                 if pen_is_up:
@@ -53,17 +57,17 @@ class GCodeGenerator:
                     pen_is_up = False
                 
                 # Draw line segments
-                for i in range(1, len(line.points)):
-                    point = line.points[i]
-                    gcode.append(f'G1 X{point.x:.3f} Y{point.y:.3f} F{self.settings.get("feed_rate_draw")}')
+                for i in range(1, len(points)):
+                    point = points[i]
+                    gcode.append(f'G1 X{point.x:.3f} Y{point.y:.3f} F{feed_draw}')
                 
-                last_point = line.points[-1]
+                last_point = points[-1]
         
         # Footer - pen up and return home
         gcode.append('')
         gcode.append('; End of drawing')
         gcode.append(self.settings.get_pen_up_command())
-        gcode.append(f'G0 X0 Y0 F{self.settings.get("feed_rate_travel")} ; Return home')
+        gcode.append(f'G0 X0 Y0 F{feed_travel} ; Return home')
         
         return gcode
     
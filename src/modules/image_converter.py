@@ -11,6 +11,18 @@ import numpy as np
 from .turtle import Turtle
 from .plotter_settings import PlotterSettings
 
+# 4x4 Bayer ordered-dither thresholds, indexed as _BAYER4[row % 4, col % 4]
+_BAYER4 = np.array([
+    [0.0, 0.5, 0.125, 0.625],
+    [0.75, 0.25, 0.875, 0.375],
+    [0.1875, 0.6875, 0.0625, 0.5625],
+    [0.9375, 0.4375, 0.8125, 0.3125]
+], dtype=np.float32)
+
+# Same thresholds as integer levels 0-15. Compared against _ink_levels() output
+# the per-pixel test runs on bytes and gives exactly the float result.
+_BAYER4_U8 = (_BAYER4 * 16).astype(np.uint8)
+
 
 class ImageConverter:
     """Converts images to Turtle paths using various algorithms."""
@@ -181,6 +193,7 @@ class ImageConverter:
     
     def __init__(self, settings: PlotterSettings):
         self.settings = settings
+        self._thresholds = None  # Per-pixel Bayer grid, see _dither_thresholds()
     
     def list_converters(self) -> List[Dict]:
         """List available converters with their options."""
@@ -1077,32 +1090,11 @@ class ImageConverter:
             turtle = Turtle()
             
             # Draw dithered points as horizontal line segments
-            for row in range(0, h, spacing):
-                in_segment = False
-                start_x = None
-                
-                for col in range(w):
-                    if mask[row, col] == 1:
-                        if not in_segment:
-                            in_segment = True
-                            start_x = col
-                    else:
-                        if in_segment:
-                            x1 = start_x + offset_x
-                            x2 = (col - 1) + offset_x
-                            y = (h - 1 - row) + offset_y
-                            if x2 > x1:
-                                turtle.jump_to(x1, y)
-                                turtle.move_to(x2, y)
-                            in_segment = False
-                
-                if in_segment:
-                    x1 = start_x + offset_x
-                    x2 = (w - 1) + offset_x
-                    y = (h - 1 - row) + offset_y
-                    if x2 > x1:
-                        turtle.jump_to(x1, y)
-                        turtle.move_to(x2, y)
+            for r, start, end in zip(*self._mask_runs(mask[::spacing] == 1)):
+                if end - 1 > start:
+                    y = (h - 1 - r * spacing) + offset_y
+                    turtle.jump_to(start + offset_x, y)
+                    turtle.move_to(end - 1 + offset_x, y)
             
             if turtle.get_paths():
                 layers.append({
@@ -1166,6 +1158,9 @@ class ImageConverter:
             'black': 45
         }
         
+        # Dither thresholds depend only on pixel position - gather once for all channels
+        thresholds = self._dither_thresholds(h, w)
+        
         layers = []
         for cmyk_channel, pen in self.CMYK_PENS.items():
             channel_data = cmyk[:, :, list(self.CMYK_PENS.keys()).index(cmyk_channel)]
@@ -1179,7 +1174,7 @@ class ImageConverter:
             
             # Draw crosshatch lines based on channel intensity
             self._draw_intensity_crosshatch(turtle, channel_data, w, h,
-                                           offset_x, offset_y, base_spacing, angle)
+                                           offset_x, offset_y, base_spacing, angle, thresholds)
             
             if turtle.get_paths():
                 layers.append({
@@ -1192,35 +1187,37 @@ class ImageConverter:
     
     def _draw_intensity_crosshatch(self, turtle: Turtle, intensity: np.ndarray,
                                    w: int, h: int, offset_x: float, offset_y: float,
-                                   base_spacing: int, angle: float):
+                                   base_spacing: int, angle: float, thresholds: np.ndarray):
         """Draw crosshatch lines where intensity determines line density."""
         rad = math.radians(angle)
         cos_a = math.cos(rad)
         sin_a = math.sin(rad)
         
+        # Use ordered dithering pattern - threshold varies by position
+        # This creates halftone-like patterns where even low ink values get representation
+        hits = self._ink_levels(intensity) > thresholds
+        bbox = self._ink_bbox(hits)
+        if bbox is None:
+            return
+        hits = hits.tolist()
+        
         max_dist = int(math.sqrt(w**2 + h**2))
         
-        for d in range(-max_dist, max_dist, base_spacing):
+        # Lines and steps that never reach a hit pixel draw nothing - skip them
+        d_range, t_range = self._hatch_window(bbox, w, h, max_dist, base_spacing,
+                                              (cos_a, sin_a), (-sin_a, cos_a))
+        
+        for d in d_range:
             in_segment = False
             start_pt = None
             last_pt = None
             
-            for t in range(-max_dist, max_dist, 1):
+            for t in t_range:
                 px = int(d * cos_a - t * sin_a + w/2)
                 py = int(d * sin_a + t * cos_a + h/2)
                 
                 if 0 <= px < w and 0 <= py < h:
-                    ink = intensity[py, px]
-                    # Use ordered dithering pattern - threshold varies by position
-                    # This creates halftone-like patterns where even low ink values get representation
-                    dither_matrix = [
-                        [0.0, 0.5, 0.125, 0.625],
-                        [0.75, 0.25, 0.875, 0.375],
-                        [0.1875, 0.6875, 0.0625, 0.5625],
-                        [0.9375, 0.4375, 0.8125, 0.3125]
-                    ]
-                    threshold = dither_matrix[py % 4][px % 4]
-                    draw = ink > threshold
+                    draw = hits[py][px]
                     
                     if draw:
                         if not in_segment:
@@ -1418,32 +1415,10 @@ class ImageConverter:
             
             turtle = Turtle()
             
-            for row in range(0, h, spacing):
-                in_segment = False
-                start_x = None
-                
-                for col in range(w):
-                    if mask[row, col] == 1:
-                        if not in_segment:
-                            in_segment = True
-                            start_x = col
-                    else:
-                        if in_segment:
-                            x1 = start_x + offset_x
-                            x2 = (col - 1) + offset_x
-                            y = row + offset_y
-                            if x2 >= x1:
-                                turtle.jump_to(x1, y)
-                                turtle.move_to(x2, y)
-                            in_segment = False
-                
-                if in_segment:
-                    x1 = start_x + offset_x
-                    x2 = (w - 1) + offset_x
-                    y = row + offset_y
-                    if x2 >= x1:
-                        turtle.jump_to(x1, y)
-                        turtle.move_to(x2, y)
+            for r, start, end in zip(*self._mask_runs(mask[::spacing] == 1)):
+                y = r * spacing + offset_y
+                turtle.jump_to(start + offset_x, y)
+                turtle.move_to(end - 1 + offset_x, y)
             
             if turtle.get_paths():
                 layers.append({
@@ -1458,6 +1433,7 @@ class ImageConverter:
                              w: int, h: int, offset_x: float, offset_y: float, density: float) -> Dict:
         """Crosshatch at screen angles for halftone."""
         base_spacing = max(2, int(100 / density * 3))
+        thresholds = self._dither_thresholds(h, w)
         
         layers = []
         for channel in channels:
@@ -1470,7 +1446,7 @@ class ImageConverter:
             angle = angles[channel]
             
             self._draw_halftone_crosshatch_lines(turtle, data, w, h,
-                                                  offset_x, offset_y, base_spacing, angle)
+                                                  offset_x, offset_y, base_spacing, angle, thresholds)
             
             if turtle.get_paths():
                 layers.append({
@@ -1485,13 +1461,7 @@ class ImageConverter:
                              w: int, h: int, offset_x: float, offset_y: float, density: float) -> Dict:
         """Horizontal lines with varying density for halftone."""
         spacing = max(2, int(100 / density * 3))
-        
-        dither_matrix = [
-            [0.0, 0.5, 0.125, 0.625],
-            [0.75, 0.25, 0.875, 0.375],
-            [0.1875, 0.6875, 0.0625, 0.5625],
-            [0.9375, 0.4375, 0.8125, 0.3125]
-        ]
+        thresholds = self._dither_thresholds(h, w)
         
         layers = []
         for channel in channels:
@@ -1500,37 +1470,18 @@ class ImageConverter:
             if np.max(data) < 0.001:
                 continue
             
+            # Only scan the sampled rows/columns that can hold ink
+            r0, r1, c0, c1 = self._ink_bbox(data > 0)
+            r0 -= r0 % spacing
+            window = (slice(r0, r1 + 1, spacing), slice(c0, c1 + 1))
+            
             turtle = Turtle()
             
-            for row in range(0, h, spacing):
-                in_segment = False
-                start_x = None
-                
-                for col in range(w):
-                    ink = data[row, col]
-                    threshold = dither_matrix[row % 4][col % 4]
-                    
-                    if ink > threshold:
-                        if not in_segment:
-                            in_segment = True
-                            start_x = col
-                    else:
-                        if in_segment:
-                            x1 = start_x + offset_x
-                            x2 = (col - 1) + offset_x
-                            y = row + offset_y
-                            if x2 >= x1:
-                                turtle.jump_to(x1, y)
-                                turtle.move_to(x2, y)
-                            in_segment = False
-                
-                if in_segment:
-                    x1 = start_x + offset_x
-                    x2 = (w - 1) + offset_x
-                    y = row + offset_y
-                    if x2 >= x1:
-                        turtle.jump_to(x1, y)
-                        turtle.move_to(x2, y)
+            hits = self._ink_levels(data[window]) > thresholds[window]
+            for r, start, end in zip(*self._mask_runs(hits)):
+                y = r * spacing + r0 + offset_y
+                turtle.jump_to(start + c0 + offset_x, y)
+                turtle.move_to(end - 1 + c0 + offset_x, y)
             
             if turtle.get_paths():
                 layers.append({
@@ -1541,18 +1492,66 @@ class ImageConverter:
         
         return {'layers': layers}
     
+    def _dither_thresholds(self, h: int, w: int) -> np.ndarray:
+        """Bayer threshold level for every pixel of an h x w image (cached per size)."""
+        if self._thresholds is None or self._thresholds.shape != (h, w):
+            self._thresholds = np.tile(_BAYER4_U8, (-(-h // 4), -(-w // 4)))[:h, :w]
+        return self._thresholds
+    
+    def _ink_levels(self, data: np.ndarray) -> np.ndarray:
+        """Quantize 0-1 ink to uint8 levels so ink > k/16 becomes level > k."""
+        return np.clip(np.ceil(data * 16), 0, 16).astype(np.uint8)
+    
+    def _ink_bbox(self, mask: np.ndarray):
+        """Inclusive (row0, row1, col0, col1) bounds of the True cells in mask, or None."""
+        rows = np.flatnonzero(mask.any(axis=1))
+        if rows.size == 0:
+            return None
+        cols = np.flatnonzero(mask.any(axis=0))
+        return int(rows[0]), int(rows[-1]), int(cols[0]), int(cols[-1])
+    
+    def _hatch_window(self, bbox, w: int, h: int, max_dist: int, spacing: int,
+                      d_axis, t_axis):
+        """Restrict a hatch sweep to the lines and steps that can reach bbox.
+        
+        The sweep samples pixel (w/2, h/2) + d * d_axis + t * t_axis for d in
+        range(-max_dist, max_dist, spacing) and t in range(-max_dist, max_dist).
+        Returns the (d_range, t_range) sub-ranges whose samples can land inside
+        bbox; every sample outside them misses it.
+        """
+        r0, r1, c0, c1 = bbox
+        # int() truncation maps anything within a pixel of the box onto it
+        corners = [(x - w / 2, y - h / 2)
+                   for x in (c0 - 2, c1 + 2) for y in (r0 - 2, r1 + 2)]
+        ds = [x * d_axis[0] + y * d_axis[1] for x, y in corners]
+        ts = [x * t_axis[0] + y * t_axis[1] for x, y in corners]
+        
+        d_start = -max_dist + max(0, math.ceil((min(ds) + max_dist) / spacing)) * spacing
+        d_range = range(d_start, min(max_dist, math.floor(max(ds)) + 1), spacing)
+        t_range = range(max(-max_dist, math.floor(min(ts))),
+                        min(max_dist, math.floor(max(ts)) + 1))
+        return d_range, t_range
+    
+    def _mask_runs(self, mask: np.ndarray):
+        """Find horizontal runs of True in a 2D mask.
+        
+        Returns (row, start, end) lists in row-major order, with `end` exclusive.
+        """
+        rows, width = mask.shape
+        padded = np.zeros((rows, width + 2), dtype=np.int8)
+        padded[:, 1:-1] = mask
+        edges = np.diff(padded, axis=1)
+        run_rows, starts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        return run_rows.tolist(), starts.tolist(), ends.tolist()
+    
     def _halftone_dots(self, channel_data: Dict, channels: List, pens: Dict,
                        w: int, h: int, offset_x: float, offset_y: float, density: float) -> Dict:
         """Dot pattern for halftone."""
         spacing = max(2, int(100 / density * 3))
         dot_size = max(0.5, spacing / 4)
         
-        dither_matrix = [
-            [0.0, 0.5, 0.125, 0.625],
-            [0.75, 0.25, 0.875, 0.375],
-            [0.1875, 0.6875, 0.0625, 0.5625],
-            [0.9375, 0.4375, 0.8125, 0.3125]
-        ]
+        thresholds = self._dither_thresholds(h, w)
         
         layers = []
         for channel in channels:
@@ -1561,18 +1560,20 @@ class ImageConverter:
             if np.max(data) < 0.001:
                 continue
             
+            # Only sample the grid positions that can hold ink
+            r0, r1, c0, c1 = self._ink_bbox(data > 0)
+            r0 -= r0 % spacing
+            c0 -= c0 % spacing
+            window = (slice(r0, r1 + 1, spacing), slice(c0, c1 + 1, spacing))
+            
             turtle = Turtle()
             
-            for row in range(0, h, spacing):
-                for col in range(0, w, spacing):
-                    ink = data[row, col]
-                    threshold = dither_matrix[row % 4][col % 4]
-                    
-                    if ink > threshold:
-                        x = col + offset_x
-                        y = row + offset_y
-                        turtle.jump_to(x, y)
-                        turtle.move_to(x + dot_size, y)
+            hits = self._ink_levels(data[window]) > thresholds[window]
+            for r, c in np.argwhere(hits).tolist():
+                x = c * spacing + c0 + offset_x
+                y = r * spacing + r0 + offset_y
+                turtle.jump_to(x, y)
+                turtle.move_to(x + dot_size, y)
             
             if turtle.get_paths():
                 layers.append({
@@ -1698,38 +1699,38 @@ class ImageConverter:
     
     def _draw_halftone_crosshatch_lines(self, turtle: Turtle, intensity: np.ndarray,
                                          w: int, h: int, offset_x: float, offset_y: float,
-                                         base_spacing: int, angle: float):
+                                         base_spacing: int, angle: float, thresholds: np.ndarray):
         """Draw crosshatch lines with ordered dithering for halftone."""
         rad = math.radians(angle)
         cos_a = math.cos(rad)
         sin_a = math.sin(rad)
+        hits = self._ink_levels(intensity) > thresholds
+        bbox = self._ink_bbox(hits)
+        if bbox is None:
+            return
+        hits = hits.tolist()
         
         # Calculate line range to cover entire image
         max_dist = int(math.sqrt(w**2 + h**2)) + base_spacing
         
-        dither_matrix = [
-            [0.0, 0.5, 0.125, 0.625],
-            [0.75, 0.25, 0.875, 0.375],
-            [0.1875, 0.6875, 0.0625, 0.5625],
-            [0.9375, 0.4375, 0.8125, 0.3125]
-        ]
+        # Lines and steps that never reach a hit pixel draw nothing - skip them
+        d_range, t_range = self._hatch_window(bbox, w, h, max_dist, base_spacing,
+                                              (cos_a, sin_a), (sin_a, -cos_a))
         
         # Draw lines perpendicular to angle
-        for d in range(-max_dist, max_dist, base_spacing):
+        for d in d_range:
             in_segment = False
             start_pt = None
             last_pt = None
             
             # Sample along the line
-            for t in range(-max_dist, max_dist, 1):
+            for t in t_range:
                 # Calculate position along line perpendicular to angle
                 px = int(w/2 + d * cos_a + t * sin_a)
                 py = int(h/2 + d * sin_a - t * cos_a)
                 
                 if 0 <= px < w and 0 <= py < h:
-                    ink = intensity[py, px]
-                    threshold = dither_matrix[py % 4][px % 4]
-                    draw = ink > threshold
+                    draw = hits[py][px]
                     
                     if draw:
                         if not in_segment:
@@ -65,11 +65,16 @@ DEFAULT_SETTINGS = {
 class PlotterSettings:
     """Manages plotter settings with persistence."""
     
+    # Settings read on every generated G-code line, mirrored as attributes
+    # and baked into the cached command strings below
+    FAST_PATH_KEYS = ('feed_rate_draw', 'feed_rate_travel', 'pen_angle_up', 'pen_angle_down')
+    
     def __init__(self, config_path: str = None):
         self.config_path = config_path or os.path.join(
             os.path.dirname(__file__), '..', 'config', 'settings.json'
         )
         self.settings: Dict[str, Any] = DEFAULT_SETTINGS.copy()
+        self._sync_fast_path()
         self.load()
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -79,6 +84,18 @@ class PlotterSettings:
     def set(self, key: str, value: Any):
         """Set a setting value."""
         self.settings[key] = value
+        if key in self.FAST_PATH_KEYS:
+            self._sync_fast_path()
+    
+    def _sync_fast_path(self):
+        """Refresh the attribute mirror of hot settings and cached commands."""
+        for key in self.FAST_PATH_KEYS:
+            setattr(self, key, self.settings.get(key))
+        
+        self._pen_up_cmd = f"G0 Z{self.pen_angle_up} F1000"
+        self._pen_down_cmd = f"G0 Z{self.pen_angle_down} F1000"
+        self._draw_fmt = f"G1 X{{:.3f}} Y{{:.3f}} F{self.feed_rate_draw}"
+        self._travel_fmt = f"G0 X{{:.3f}} Y{{:.3f}} F{self.feed_rate_travel}"
     
     def get_all(self) -> Dict[str, Any]:
         """Get all settings."""
@@ -87,6 +104,7 @@ class PlotterSettings:
     def update(self, data: Dict[str, Any]):
         """Update multiple settings."""
         self.settings.update(data)
+        self._sync_fast_path()
     
     def load(self):
         """Load settings from file."""
@@ -95,6 +113,7 @@ class PlotterSettings:
                 with open(self.config_path, 'r') as f:
                     loaded = json.load(f)
                     self.settings.update(loaded)
+                    self._sync_fast_path()
         except Exception as e:
             print(f"Error loading settings: {e}")
     
@@ -109,16 +128,15 @@ class PlotterSettings:
     
     def get_pen_up_command(self) -> str:
         """Get the pen up G-code command (uses G0 Z for Makelangelo firmware)."""
-        return f"G0 Z{self.get('pen_angle_up')} F1000"
+        return self._pen_up_cmd
     
     def get_pen_down_command(self) -> str:
         """Get the pen down G-code command (uses G0 Z for Makelangelo firmware)."""
-        return f"G0 Z{self.get('pen_angle_down')} F1000"
+        return self._pen_down_cmd
     
     def get_goto_command(self, x: float, y: float, pen_down: bool = False) -> str:
         """Get a move command."""
-        feedrate = self.get('feed_rate_draw' if pen_down else 'feed_rate_travel')
-        return f"G{'1' if pen_down else '0'} X{x:.3f} Y{y:.3f} F{feedrate}"
+        return (self._draw_fmt if pen_down else self._travel_fmt).format(x, y)
     
     def get_work_area(self) -> Dict[str, float]:
         """Get the work area bounds."""
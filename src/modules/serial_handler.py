@@ -1,6 +1,6 @@
 """
 Serial communication handler for the polargraph plotter.
-Handles connection, command queuing, and checksum generation.
+Handles connection and command queuing.
 """
 
 import serial
@@ -14,6 +14,7 @@ class SerialHandler:
     """Handles serial communication with the plotter."""
     
     BAUD_RATE = 57600  # Match firmware config
+    ENCODING = 'utf-8'  # Wire encoding for every command sent
     
     def __init__(self):
         self.serial: Optional[serial.Serial] = None
@@ -23,6 +24,7 @@ class SerialHandler:
         self.running = False
         self.line_number = 0
         self.command_queue: List[str] = []
+        self._scratch = bytearray()  # Reused encode buffer for send_command()
         self.busy_count = 16  # Buffer size
         self.lock = threading.Lock()
     
@@ -43,7 +45,7 @@ class SerialHandler:
                 bytesize=serial.EIGHTBITS,
                 stopbits=serial.STOPBITS_ONE,
                 parity=serial.PARITY_NONE,
-                timeout=0.1
+                timeout=1.0  # read_until() blocks up to this long; cancel_read() wakes it early
             )
             
             self.current_port = port
@@ -68,6 +70,13 @@ class SerialHandler:
         """Disconnect from the serial port."""
         self.running = False
         
+        # Wake the reader if it is blocked inside read_until()
+        if self.serial and self.serial.is_open and hasattr(self.serial, 'cancel_read'):
+            try:
+                self.serial.cancel_read()
+            except Exception:
+                pass
+        
         if self.read_thread and self.read_thread.is_alive():
             self.read_thread.join(timeout=1)
         
@@ -89,7 +98,13 @@ class SerialHandler:
         with self.lock:
             cmd = command.strip()
             try:
-                self.serial.write(f"{cmd}\n".encode('utf-8'))
+                # Reuse one buffer instead of building a new str and bytes
+                # object for every line
+                buf = self._scratch
+                buf.clear()
+                buf += cmd.encode(self.ENCODING)
+                buf += b'\n'
+                self.serial.write(buf)
                 self.serial.flush()
                 print(f"  -> {cmd}")  # Debug output
                 # Notify callback about sent command
@@ -100,46 +115,63 @@ class SerialHandler:
                 if self.callback:
                     self.callback(f"ERROR: {e}")
     
+    def send_many(self, commands: List[str]):
+        """Send several G-code commands with a single write and flush."""
+        if not self.is_connected():
+            return
+        
+        cmds = [c.strip() for c in commands if c.strip()]
+        if not cmds:
+            return
+        
+        with self.lock:
+            try:
+                self.serial.write(('\n'.join(cmds) + '\n').encode(self.ENCODING))
+                self.serial.flush()
+                for cmd in cmds:
+                    print(f"  -> {cmd}")  # Debug output
+                    if self.callback:
+                        self.callback(f"TX: {cmd}")
+            except Exception as e:
+                print(f"Send error: {e}")
+                if self.callback:
+                    self.callback(f"ERROR: {e}")
+    
     def send_raw(self, command: str):
         """Send a raw command without line number or checksum."""
         if not self.is_connected():
             return
         
         try:
-            self.serial.write(f"{command}\n".encode('utf-8'))
+            self.serial.write(f"{command}\n".encode(self.ENCODING))
             self.serial.flush()
         except Exception as e:
             print(f"Send error: {e}")
     
-    def _calculate_checksum(self, line: str) -> int:
-        """Calculate XOR checksum for a command."""
-        checksum = 0
-        for char in line:
-            checksum ^= ord(char)
-        return checksum & 0xFF
-    
     def _read_loop(self):
         """Background thread for reading serial data."""
-        buffer = ""
+        buffer = b""
         
         while self.running and self.serial and self.serial.is_open:
             try:
-                if self.serial.in_waiting > 0:
-                    data = self.serial.read(self.serial.in_waiting).decode('utf-8', errors='ignore')
-                    buffer += data
-                    
-                    # Process complete lines
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        line = line.strip()
-                        
-                        if line and self.callback:
-                            self.callback(line)
-                else:
-                    time.sleep(0.01)
+                # Blocks in the OS read until a newline arrives or the port
+                # timeout expires, so an idle port costs no polling wakeups
+                data = self.serial.read_until(b'\n')
+                if not data:
+                    continue
+                
+                # A timeout can hand back a partial line - keep accumulating
+                buffer += data
+                if not buffer.endswith(b'\n'):
+                    continue
+                
+                line = buffer.decode('utf-8', errors='ignore').strip()
+                buffer = b""
+                
+                if line and self.callback:
+                    self.callback(line)
                     
             except Exception as e:
                 if self.running:
                     print(f"Read error: {e}")
                 break
-
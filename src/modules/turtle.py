@@ -4,11 +4,13 @@ Based on the Makelangelo Turtle class.
 """
 
 import math
+from array import array
 from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass, field
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """A 2D point."""
     x: float = 0.0
@@ -23,15 +25,24 @@ class Point:
         return (self.x, self.y)
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
-    """A line segment with color."""
-    points: List[Point] = field(default_factory=list)
+    """A polyline with color, stored as flat [x0, y0, x1, y1, ...] coordinates."""
+    coords: array = field(default_factory=lambda: array('d'))
     color: str = '#000000'
     diameter: float = 1.0
+    
+    def __len__(self) -> int:
+        return len(self.coords) // 2
+    
+    @property
+    def points(self) -> List[Point]:
+        """Materialize the coordinates as Point objects (a copy, not a view)."""
+        c = self.coords
+        return [Point(c[i], c[i + 1]) for i in range(0, len(c), 2)]
 
 
-@dataclass
+@dataclass(slots=True)
 class StrokeLayer:
     """A layer of strokes with the same color and diameter."""
     lines: List[Line] = field(default_factory=list)
@@ -53,6 +64,10 @@ class Turtle:
         self.color = color
         self.diameter = diameter
         
+        # Cached (min_x, min_y, max_x, max_y), recomputed lazily after mutation
+        self._bounds: Optional[Tuple[float, float, float, float]] = None
+        self._bounds_dirty = True
+        
         # Create initial layer
         self._new_layer()
     
@@ -70,9 +85,10 @@ class Turtle:
     
     def _new_line(self):
         """Start a new line in the current layer."""
-        line = Line(points=[Point(self.position.x, self.position.y)],
+        line = Line(coords=array('d', (self.position.x, self.position.y)),
                     color=self.color, diameter=self.diameter)
         self._current_layer().lines.append(line)
+        self._bounds_dirty = True
     
     def set_stroke(self, color: str, diameter: float):
         """Set the pen color and diameter."""
@@ -101,7 +117,8 @@ class Turtle:
         if not self.pen_up:
             layer = self._current_layer()
             if layer.lines:
-                layer.lines[-1].points.append(Point(x, y))
+                layer.lines[-1].coords.extend((x, y))
+                self._bounds_dirty = True
     
     def jump_to(self, x: float, y: float):
         """Jump to a position (pen up, move, pen down)."""
@@ -145,15 +162,14 @@ class Turtle:
         
         delta = (end_angle - start_angle) / steps
         
+        xs = []
+        ys = []
         for i in range(steps + 1):
             angle = start_angle + delta * i
-            x = cx + math.cos(angle) * radius
-            y = cy + math.sin(angle) * radius
-            
-            if i == 0:
-                self.jump_to(x, y)
-            else:
-                self.move_to(x, y)
+            xs.append(cx + math.cos(angle) * radius)
+            ys.append(cy + math.sin(angle) * radius)
+        
+        self.extend_polyline(xs, ys)
     
     def draw_circle(self, cx: float, cy: float, radius: float, steps: int = 36):
         """Draw a circle."""
@@ -166,34 +182,104 @@ class Turtle:
     
     def draw_rect(self, x: float, y: float, width: float, height: float):
         """Draw a rectangle."""
-        self.jump_to(x, y)
-        self.move_to(x + width, y)
-        self.move_to(x + width, y + height)
-        self.move_to(x, y + height)
-        self.move_to(x, y)
+        self.extend_polyline((x, x + width, x + width, x, x),
+                             (y, y, y + height, y + height, y))
+    
+    def extend_polyline(self, xs, ys):
+        """Draw a polyline through parallel x/y sequences in one call.
+        
+        Same result as jump_to() the first point and move_to() the rest, but the
+        coordinates are appended to the line buffer in bulk.
+        """
+        n = len(xs)
+        if n == 0:
+            return
+        
+        self.jump_to(float(xs[0]), float(ys[0]))
+        if n > 1:
+            coords = self._current_layer().lines[-1].coords
+            if isinstance(xs, np.ndarray) or isinstance(ys, np.ndarray):
+                xy = np.empty(2 * n)
+                xy[0::2] = xs
+                xy[1::2] = ys
+                coords.frombytes(xy[2:].tobytes())
+            else:
+                # Short Python sequences interleave faster without NumPy
+                xy = [0.0] * (2 * n)
+                xy[0::2] = xs
+                xy[1::2] = ys
+                coords.extend(xy[2:])
+            self.position.x = float(xy[-2])
+            self.position.y = float(xy[-1])
+            self._bounds_dirty = True
+    
+    def draw_segments(self, x1, y1, x2, y2):
+        """Draw independent line segments from parallel endpoint sequences.
+        
+        Same result as draw_line() for each segment in order, but the lines
+        are built in bulk.
+        """
+        n = len(x1)
+        if n == 0:
+            return
+        
+        xy = np.empty((n, 4))
+        xy[:, 0] = x1
+        xy[:, 1] = y1
+        xy[:, 2] = x2
+        xy[:, 3] = y2
+        
+        lines = self._current_layer().lines
+        color = self.color
+        diameter = self.diameter
+        for seg in xy.tolist():
+            lines.append(Line(coords=array('d', seg), color=color, diameter=diameter))
+        
+        self.pen_up = False
+        self.position.x = float(xy[-1, 2])
+        self.position.y = float(xy[-1, 3])
+        self._bounds_dirty = True
+    
+    def draw_polylines(self, xs, ys):
+        """Draw one polyline per row of equally shaped 2D x/y arrays.
+        
+        Same result as extend_polyline() for each row in order, but the lines
+        are built in bulk.
+        """
+        xs = np.asarray(xs, dtype=float)
+        n, k = xs.shape
+        if n == 0 or k == 0:
+            return
+        
+        xy = np.empty((n, 2 * k))
+        xy[:, 0::2] = xs
+        xy[:, 1::2] = ys
+        
+        lines = self._current_layer().lines
+        color = self.color
+        diameter = self.diameter
+        for row in xy.tolist():
+            lines.append(Line(coords=array('d', row), color=color, diameter=diameter))
+        
+        self.pen_up = False
+        self.position.x = float(xy[-1, -2])
+        self.position.y = float(xy[-1, -1])
+        self._bounds_dirty = True
     
     # ========================================================================
     # Query methods
     # ========================================================================
     
     def get_bounds(self) -> Dict[str, float]:
-        """Get the bounding box of all paths."""
-        min_x = float('inf')
-        min_y = float('inf')
-        max_x = float('-inf')
-        max_y = float('-inf')
-        
-        for layer in self.layers:
-            for line in layer.lines:
-                for point in line.points:
-                    min_x = min(min_x, point.x)
-                    min_y = min(min_y, point.y)
-                    max_x = max(max_x, point.x)
-                    max_y = max(max_y, point.y)
+        """Get the bounding box of all paths (cached until the paths change)."""
+        if self._bounds_dirty:
+            self._bounds = self._compute_bounds()
+            self._bounds_dirty = False
         
-        if min_x == float('inf'):
+        if self._bounds is None:
             return {'min_x': 0, 'min_y': 0, 'max_x': 0, 'max_y': 0, 'width': 0, 'height': 0}
         
+        min_x, min_y, max_x, max_y = self._bounds
         return {
             'min_x': min_x,
             'min_y': min_y,
@@ -203,12 +289,23 @@ class Turtle:
             'height': max_y - min_y
         }
     
+    def _compute_bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Compute the bounding box of every point in one NumPy pass, or None if empty."""
+        data = b''.join(line.coords for layer in self.layers for line in layer.lines)
+        if not data:
+            return None
+        
+        xy = np.frombuffer(data).reshape(-1, 2)
+        min_x, min_y = xy.min(axis=0).tolist()
+        max_x, max_y = xy.max(axis=0).tolist()
+        return (min_x, min_y, max_x, max_y)
+    
     def count_points(self) -> int:
         """Count total points."""
         total = 0
         for layer in self.layers:
             for line in layer.lines:
-                total += len(line.points)
+                total += len(line)
         return total
     
     def count_lines(self) -> int:
@@ -216,31 +313,39 @@ class Turtle:
         total = 0
         for layer in self.layers:
             for line in layer.lines:
-                total += max(0, len(line.points) - 1)
+                total += max(0, len(line) - 1)
         return total
     
+    def _stacked_coords(self) -> Tuple[np.ndarray, np.ndarray]:
+        """All vertices as one (N, 2) array, plus the point count of each non-empty line."""
+        bufs = [line.coords for layer in self.layers for line in layer.lines if line.coords]
+        if not bufs:
+            return np.empty((0, 2)), np.empty(0, dtype=np.intp)
+        
+        counts = np.fromiter((len(b) // 2 for b in bufs), dtype=np.intp, count=len(bufs))
+        xy = np.concatenate([np.frombuffer(b, dtype=np.float64) for b in bufs]).reshape(-1, 2)
+        return xy, counts
+    
+    def _segment_lengths(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Lengths of consecutive vertex gaps, and a mask of those that are pen-up jumps."""
+        xy, counts = self._stacked_coords()
+        if len(xy) < 2:
+            return np.empty(0), np.empty(0, dtype=bool)
+        
+        seg = np.hypot(*np.diff(xy, axis=0).T)
+        jumps = np.zeros(len(seg), dtype=bool)
+        jumps[np.cumsum(counts)[:-1] - 1] = True
+        return seg, jumps
+    
     def get_draw_distance(self) -> float:
         """Get total drawing distance."""
-        total = 0.0
-        for layer in self.layers:
-            for line in layer.lines:
-                for i in range(len(line.points) - 1):
-                    total += line.points[i].distance_to(line.points[i + 1])
-        return total
+        seg, jumps = self._segment_lengths()
+        return float(seg[~jumps].sum())
     
     def get_travel_distance(self) -> float:
         """Get total travel distance (pen up moves)."""
-        total = 0.0
-        last_point = None
-        
-        for layer in self.layers:
-            for line in layer.lines:
-                if line.points and last_point:
-                    total += last_point.distance_to(line.points[0])
-                if line.points:
-                    last_point = line.points[-1]
-        
-        return total
+        seg, jumps = self._segment_lengths()
+        return float(seg[jumps].sum())
     
     def get_paths(self) -> List[Dict]:
         """Get all paths as a list of dictionaries for JSON serialization."""
@@ -248,9 +353,10 @@ class Turtle:
         
         for layer in self.layers:
             for line in layer.lines:
-                if len(line.points) >= 2:
+                if len(line) >= 2:
+                    c = line.coords
                     paths.append({
-                        'points': [{'x': p.x, 'y': p.y} for p in line.points],
+                        'points': [{'x': c[i], 'y': c[i + 1]} for i in range(0, len(c), 2)],
                         'color': layer.color,
                         'diameter': layer.diameter
                     })
@@ -262,7 +368,7 @@ class Turtle:
         lines = []
         for layer in self.layers:
             for line in layer.lines:
-                if len(line.points) >= 2:
+                if len(line) >= 2:
                     lines.append(line)
         return lines
     
@@ -270,32 +376,49 @@ class Turtle:
         """Check if the turtle has any drawn content."""
         for layer in self.layers:
             for line in layer.lines:
-                if len(line.points) >= 2:
+                if len(line) >= 2:
                     return True
         return False
     
+    def copy(self) -> 'Turtle':
+        """Independent copy of the paths and pen state."""
+        clone = Turtle(self.color, self.diameter)
+        clone.layers = [
+            StrokeLayer(
+                lines=[Line(coords=line.coords[:], color=line.color, diameter=line.diameter)
+                       for line in layer.lines],
+                color=layer.color,
+                diameter=layer.diameter
+            )
+            for layer in self.layers
+        ]
+        clone.position = Point(self.position.x, self.position.y)
+        clone.angle = self.angle
+        clone.pen_up = self.pen_up
+        clone._bounds = self._bounds
+        clone._bounds_dirty = self._bounds_dirty
+        return clone
+    
     # ========================================================================
     # Transform methods
     # ========================================================================
     
     def translate(self, dx: float, dy: float):
         """Translate all paths."""
-        for layer in self.layers:
-            for line in layer.lines:
-                for point in line.points:
-                    point.x += dx
-                    point.y += dy
+        self._map_coords(lambda x, y: (x + dx, y + dy))
+        
+        # Translation shifts the cached bounding box without changing its size
+        if not self._bounds_dirty and self._bounds is not None:
+            min_x, min_y, max_x, max_y = self._bounds
+            self._bounds = (min_x + dx, min_y + dy, max_x + dx, max_y + dy)
     
     def scale(self, sx: float, sy: float = None):
         """Scale all paths."""
         if sy is None:
             sy = sx
         
-        for layer in self.layers:
-            for line in layer.lines:
-                for point in line.points:
-                    point.x *= sx
-                    point.y *= sy
+        self._map_coords(lambda x, y: (x * sx, y * sy))
+        self._bounds_dirty = True
     
     def rotate(self, degrees: float):
         """Rotate all paths around the origin."""
@@ -303,13 +426,29 @@ class Turtle:
         cos_a = math.cos(rad)
         sin_a = math.sin(rad)
         
-        for layer in self.layers:
-            for line in layer.lines:
-                for point in line.points:
-                    x = point.x
-                    y = point.y
-                    point.x = x * cos_a - y * sin_a
-                    point.y = x * sin_a + y * cos_a
+        self._map_coords(lambda x, y: (x * cos_a - y * sin_a, x * sin_a + y * cos_a))
+        self._bounds_dirty = True
+    
+    def _map_coords(self, fn):
+        """Replace every (x, y) with fn(x, y), evaluated once on all coordinates.
+        
+        fn receives the x and y values as NumPy arrays. The lines' flat buffers
+        are gathered into one array, transformed, and copied back in place.
+        """
+        lines = [line for layer in self.layers for line in layer.lines if line.coords]
+        if not lines:
+            return
+        
+        xy = np.frombuffer(b''.join(line.coords for line in lines))
+        out = np.empty_like(xy)
+        out[0::2], out[1::2] = fn(xy[0::2], xy[1::2])
+        
+        out = memoryview(out)
+        start = 0
+        for line in lines:
+            end = start + len(line.coords)
+            memoryview(line.coords)[:] = out[start:end]
+            start = end
     
     def center_on(self, cx: float, cy: float):
         """Center the drawing on a point."""
@@ -336,9 +475,19 @@ class Turtle:
             s = min(sx, sy)
             sx = sy = s
         
-        # Center on origin, scale, then move to target center
-        self.translate(-bounds['min_x'] - bounds['width'] / 2,
-                       -bounds['min_y'] - bounds['height'] / 2)
-        self.scale(sx, sy)
-        self.translate((left + right) / 2, (bottom + top) / 2)
-
+        # Center on origin, scale, then move to target center - fused into a
+        # single x' = sx * x + tx, y' = sy * y + ty sweep over the points
+        tx = (left + right) / 2 - sx * (bounds['min_x'] + bounds['width'] / 2)
+        ty = (bottom + top) / 2 - sy * (bounds['min_y'] + bounds['height'] / 2)
+        self.affine(sx, sy, tx, ty)
+    
+    def affine(self, sx: float, sy: float, tx: float, ty: float):
+        """Scale then translate all paths in one pass: x' = sx * x + tx, y' = sy * y + ty."""
+        self._map_coords(lambda x, y: (x * sx + tx, y * sy + ty))
+        
+        # An axis-aligned affine maps the bounding box corners exactly
+        if not self._bounds_dirty and self._bounds is not None:
+            min_x, min_y, max_x, max_y = self._bounds
+            x1, x2 = min_x * sx + tx, max_x * sx + tx
+            y1, y2 = min_y * sy + ty, max_y * sy + ty
+            self._bounds = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
@@ -3,18 +3,538 @@ Turtle graphics pattern generators.
 Implements various algorithmic patterns (spirograph, maze, fractals, etc.)
 """
 
+import copy
+import logging
 import math
 import random
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import combinations
+from types import MappingProxyType
 from typing import Dict, List, Any, Tuple
 
+import numpy as np
+from scipy.spatial import Voronoi
+
 from .turtle import Turtle
 from .plotter_settings import PlotterSettings
 
 
+logger = logging.getLogger(__name__)
+
+
+# Single-stroke font - each letter defined as list of strokes
+# Each stroke is a list of (x, y) points normalized to 0-1
+_STROKE_FONT = {
+    'A': [[(0, 0), (0.5, 1), (1, 0)], [(0.2, 0.4), (0.8, 0.4)]],
+    'B': [[(0, 0), (0, 1), (0.7, 1), (0.8, 0.9), (0.8, 0.6), (0.7, 0.5), (0, 0.5)], 
+          [(0.7, 0.5), (0.9, 0.4), (0.9, 0.1), (0.8, 0), (0, 0)]],
+    'C': [[(1, 0.2), (0.8, 0), (0.2, 0), (0, 0.2), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8)]],
+    'D': [[(0, 0), (0, 1), (0.6, 1), (0.9, 0.8), (1, 0.5), (0.9, 0.2), (0.6, 0), (0, 0)]],
+    'E': [[(1, 0), (0, 0), (0, 1), (1, 1)], [(0, 0.5), (0.7, 0.5)]],
+    'F': [[(0, 0), (0, 1), (1, 1)], [(0, 0.5), (0.7, 0.5)]],
+    'G': [[(1, 0.8), (0.8, 1), (0.2, 1), (0, 0.8), (0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 0.5), (0.5, 0.5)]],
+    'H': [[(0, 0), (0, 1)], [(1, 0), (1, 1)], [(0, 0.5), (1, 0.5)]],
+    'I': [[(0.3, 0), (0.7, 0)], [(0.5, 0), (0.5, 1)], [(0.3, 1), (0.7, 1)]],
+    'J': [[(0, 0.2), (0.2, 0), (0.6, 0), (0.8, 0.2), (0.8, 1)]],
+    'K': [[(0, 0), (0, 1)], [(1, 1), (0, 0.5), (1, 0)]],
+    'L': [[(0, 1), (0, 0), (1, 0)]],
+    'M': [[(0, 0), (0, 1), (0.5, 0.5), (1, 1), (1, 0)]],
+    'N': [[(0, 0), (0, 1), (1, 0), (1, 1)]],
+    'O': [[(0.2, 0), (0, 0.2), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.2), (0.8, 0), (0.2, 0)]],
+    'P': [[(0, 0), (0, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0.8, 0.5), (0, 0.5)]],
+    'Q': [[(0.2, 0), (0, 0.2), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.2), (0.8, 0), (0.2, 0)], [(0.6, 0.3), (1, 0)]],
+    'R': [[(0, 0), (0, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0.8, 0.5), (0, 0.5)], [(0.5, 0.5), (1, 0)]],
+    'S': [[(1, 0.8), (0.8, 1), (0.2, 1), (0, 0.8), (0, 0.6), (0.2, 0.5), (0.8, 0.5), (1, 0.4), (1, 0.2), (0.8, 0), (0.2, 0), (0, 0.2)]],
+    'T': [[(0, 1), (1, 1)], [(0.5, 1), (0.5, 0)]],
+    'U': [[(0, 1), (0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 1)]],
+    'V': [[(0, 1), (0.5, 0), (1, 1)]],
+    'W': [[(0, 1), (0.25, 0), (0.5, 0.5), (0.75, 0), (1, 1)]],
+    'X': [[(0, 0), (1, 1)], [(0, 1), (1, 0)]],
+    'Y': [[(0, 1), (0.5, 0.5), (1, 1)], [(0.5, 0.5), (0.5, 0)]],
+    'Z': [[(0, 1), (1, 1), (0, 0), (1, 0)]],
+    '0': [[(0.2, 0), (0, 0.2), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.2), (0.8, 0), (0.2, 0)], [(0.2, 0.2), (0.8, 0.8)]],
+    '1': [[(0.3, 0.8), (0.5, 1), (0.5, 0)], [(0.2, 0), (0.8, 0)]],
+    '2': [[(0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0, 0), (1, 0)]],
+    '3': [[(0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0.8, 0.5), (0.5, 0.5)], [(0.8, 0.5), (1, 0.4), (1, 0.2), (0.8, 0), (0.2, 0), (0, 0.2)]],
+    '4': [[(0.8, 0), (0.8, 1), (0, 0.3), (1, 0.3)]],
+    '5': [[(1, 1), (0, 1), (0, 0.5), (0.8, 0.5), (1, 0.4), (1, 0.2), (0.8, 0), (0.2, 0), (0, 0.2)]],
+    '6': [[(1, 0.8), (0.8, 1), (0.2, 1), (0, 0.8), (0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 0.4), (0.8, 0.5), (0, 0.5)]],
+    '7': [[(0, 1), (1, 1), (0.3, 0)]],
+    '8': [[(0.5, 0.5), (0.2, 0.5), (0, 0.7), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.7), (0.8, 0.5), (0.5, 0.5)], 
+          [(0.5, 0.5), (0.2, 0.5), (0, 0.3), (0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 0.3), (0.8, 0.5)]],
+    '9': [[(0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 0.8), (0.8, 1), (0.2, 1), (0, 0.8), (0, 0.6), (0.2, 0.5), (1, 0.5)]],
+    '.': [[(0.4, 0.1), (0.6, 0.1), (0.6, 0), (0.4, 0), (0.4, 0.1)]],
+    ',': [[(0.5, 0.15), (0.5, 0), (0.3, -0.15)]],
+    '!': [[(0.5, 1), (0.5, 0.3)], [(0.5, 0.1), (0.5, 0)]],
+    '?': [[(0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0.5, 0.4), (0.5, 0.2)], [(0.5, 0.1), (0.5, 0)]],
+    '-': [[(0.2, 0.5), (0.8, 0.5)]],
+    ':': [[(0.5, 0.7), (0.5, 0.6)], [(0.5, 0.3), (0.5, 0.2)]],
+}
+
+
+@lru_cache(maxsize=8)
+def _scaled_font(size: float) -> Dict[str, Tuple]:
+    """_STROKE_FONT glyphs pre-scaled to a letter size, as (xs, ys) per drawable stroke."""
+    return {
+        char: tuple(
+            (tuple(px * size * 0.6 for px, _ in stroke), tuple(py * size for _, py in stroke))
+            for stroke in strokes if len(stroke) >= 2
+        )
+        for char, strokes in _STROKE_FONT.items()
+    }
+
+
+@lru_cache(maxsize=8)
+def _dragon_cells(iterations: int):
+    """Integer grid vertices (gx, gy) of the unit-step dragon curve, as read-only arrays.
+    
+    The dragon L-system (FX, X -> X+YF+, Y -> -FX-Y) draws 2^iterations
+    segments whose net turns follow the regular paper-folding sequence: after
+    segment k turn left when the bit above k's lowest set bit is 1. Reading
+    that directly avoids building the exponentially long string, and since
+    every heading is a multiple of 90 degrees the vertices are a cumulative
+    sum over a four-entry direction table - no trig at all.
+    """
+    k = np.arange(1, 1 << iterations)
+    turns = np.where(((k & -k) << 1) & k, 1, -1)
+    
+    # Heading (0 = east, 1 = north, ...) of each segment, starting east
+    heading = np.zeros(1 << iterations, dtype=np.intp)
+    np.cumsum(turns, out=heading[1:])
+    heading %= 4
+    
+    gx = np.zeros((1 << iterations) + 1, dtype=np.intp)
+    gy = np.zeros((1 << iterations) + 1, dtype=np.intp)
+    np.cumsum(np.array([1, 0, -1, 0])[heading], out=gx[1:])
+    np.cumsum(np.array([0, 1, 0, -1])[heading], out=gy[1:])
+    
+    gx.flags.writeable = False
+    gy.flags.writeable = False
+    return gx, gy
+
+
+@lru_cache(maxsize=8)
+def _hilbert_cells(order: int):
+    """Grid cell (gx, gy) of every index along an order-n Hilbert curve, as read-only arrays."""
+    # Map every curve index d to its grid cell with the iterative d2xy
+    # bit walk, all indices at once, instead of recursing through the
+    # turtle. Undoing each sub-square's rotation/reflection level by level
+    # gives the same cells the recursive L-system visits.
+    n = 1 << order
+    t = np.arange(n * n)
+    gx = np.zeros_like(t)
+    gy = np.zeros_like(t)
+    s = 1
+    while s < n:
+        rx = (t >> 1) & 1
+        ry = (t ^ rx) & 1
+        flip = (ry == 0) & (rx == 1)
+        gx = np.where(flip, s - 1 - gx, gx)
+        gy = np.where(flip, s - 1 - gy, gy)
+        swap = ry == 0
+        gx, gy = np.where(swap, gy, gx), np.where(swap, gx, gy)
+        gx += s * rx
+        gy += s * ry
+        t >>= 2
+        s <<= 1
+    
+    gx.flags.writeable = False
+    gy.flags.writeable = False
+    return gx, gy
+
+
+@lru_cache(maxsize=16)
+def _tree_path(depth: int, trunk_length: float, angle: float, ratio: float) -> Tuple[Tuple, Tuple]:
+    """Vertices of the fractal tree walk (out along each branch and back) as (xs, ys)."""
+    # Carry each branch's heading as a unit vector and rotate it with the
+    # fixed left/right rotation, so the recursion needs no trig calls
+    rad = math.radians(angle)
+    cos_a = math.cos(rad)
+    sin_a = math.sin(rad)
+    
+    # Start at bottom center, pointing up
+    xs = [0.0]
+    ys = [-200.0]
+    
+    # Depth-first walk with an explicit stack. Entries are branches to grow
+    # (x, y, hx, hy, length, level) or (x, y) forks to retrace back to once
+    # both children are done.
+    stack = [(0.0, -200.0, 0.0, 1.0, trunk_length, depth)]
+    while stack:
+        item = stack.pop()
+        if len(item) == 2:
+            xs.append(item[0])
+            ys.append(item[1])
+            continue
+        
+        x, y, hx, hy, length, level = item
+        if level == 0 or length < 2:
+            continue
+        
+        nx = x + hx * length
+        ny = y + hy * length
+        xs.append(nx)
+        ys.append(ny)
+        
+        # Pushed in reverse: left branch, then right branch, then retrace
+        stack.append((x, y))
+        stack.append((nx, ny, hx * cos_a + hy * sin_a, hy * cos_a - hx * sin_a,
+                      length * ratio, level - 1))
+        stack.append((nx, ny, hx * cos_a - hy * sin_a, hx * sin_a + hy * cos_a,
+                      length * ratio, level - 1))
+    
+    return tuple(xs), tuple(ys)
+
+
+# Simplex noise skew/unskew factors and the 12 edge gradients (x, y parts)
+_SIMPLEX_F2 = 0.5 * (math.sqrt(3.0) - 1.0)
+_SIMPLEX_G2 = (3.0 - math.sqrt(3.0)) / 6.0
+_SIMPLEX_GRAD = ((1, 1), (-1, 1), (1, -1), (-1, -1),
+                 (1, 0), (-1, 0), (1, 0), (-1, 0),
+                 (0, 1), (0, -1), (0, 1), (0, -1))
+
+
+@lru_cache(maxsize=1)
+def _simplex_tables():
+    """Doubled permutation table and per-entry gradient components for _simplex2d."""
+    # Fixed seed so the field is the same from run to run
+    perm = np.tile(np.random.default_rng(0).permutation(256), 2)
+    grad = np.array(_SIMPLEX_GRAD, dtype=float)[perm % 12]
+    return perm, grad[:, 0].copy(), grad[:, 1].copy()
+
+
+def _simplex2d(x, y):
+    """2D simplex noise in [-1, 1], evaluated over whole coordinate arrays at once."""
+    perm, grad_x, grad_y = _simplex_tables()
+    
+    # Skew into the simplex grid to find the containing triangle
+    s = (x + y) * _SIMPLEX_F2
+    i = np.floor(x + s)
+    j = np.floor(y + s)
+    t = (i + j) * _SIMPLEX_G2
+    x0 = x - (i - t)
+    y0 = y - (j - t)
+    
+    # Middle corner is (1, 0) in the lower triangle, (0, 1) in the upper
+    i1 = (x0 > y0).astype(np.intp)
+    j1 = 1 - i1
+    
+    ii = i.astype(np.intp) & 255
+    jj = j.astype(np.intp) & 255
+    corners = (
+        (x0, y0, ii + perm[jj]),
+        (x0 - i1 + _SIMPLEX_G2, y0 - j1 + _SIMPLEX_G2, ii + i1 + perm[jj + j1]),
+        (x0 - 1 + 2 * _SIMPLEX_G2, y0 - 1 + 2 * _SIMPLEX_G2, ii + 1 + perm[jj + 1]),
+    )
+    
+    total = 0.0
+    for cx, cy, hashed in corners:
+        g = perm[hashed]
+        falloff = np.maximum(0.5 - cx * cx - cy * cy, 0.0)
+        falloff *= falloff
+        total = total + falloff * falloff * (grad_x[g] * cx + grad_y[g] * cy)
+    
+    return 70.0 * total
+
+
+# Sonakinatography pen colors per entity (1-8), using only the available pen
+# colors: brown, black, blue, green, purple, pink, red, orange, yellow
+_SONA_PALETTES = MappingProxyType({
+    'rainbow': ('brown', 'blue', 'green', 'purple', 'pink', 'red', 'orange', 'yellow'),
+    'monochrome': ('black', 'black', 'black', 'black', 'black', 'black', 'black', 'black'),
+    'primary': ('red', 'yellow', 'blue', 'red', 'yellow', 'blue', 'red', 'yellow'),
+    'warm': ('red', 'orange', 'yellow', 'pink', 'red', 'orange', 'yellow', 'pink'),
+    'cool': ('blue', 'green', 'purple', 'blue', 'green', 'purple', 'blue', 'green'),
+    'earth': ('brown', 'orange', 'green', 'brown', 'orange', 'green', 'brown', 'orange'),
+    'sunset': ('red', 'orange', 'yellow', 'pink', 'purple', 'red', 'orange', 'yellow'),
+    'ocean': ('blue', 'green', 'purple', 'blue', 'green', 'purple', 'blue', 'green')
+})
+_SONA_ENTITY_NAMES = ('Beat 1', 'Beat 2', 'Beat 3', 'Beat 4', 'Beat 5', 'Beat 6', 'Beat 7', 'Beat 8')
+
+# Hatching angles per entity (1-8) - more variety
+_SONA_ENTITY_ANGLES = (30, 50, 70, 90, 110, 130, 150, 170)
+# Hatching spacing per entity, before scaling by hatch_density
+_SONA_BASE_SPACINGS = (0.6, 0.8, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0)
+
+
+@lru_cache(maxsize=16)
+def _sona_spacings(hatch_density: float) -> Tuple[float, ...]:
+    """Per-entity hatch spacings scaled by hatch_density."""
+    return tuple(s / hatch_density for s in _SONA_BASE_SPACINGS)
+
+
+# Block layouts of the beat-grid algorithms. Each depends only on the grid
+# height and the algorithm's integer options, and lists the (x, y, entity)
+# blocks in drawing order, stopping where the drawing loop used to stop.
+
+@lru_cache(maxsize=32)
+def _sona_sequential_layout(grid_height: int, starting_entity: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Cascading columns that build up from starting_entity, then repeat in full."""
+    blocks = []
+    y = 0
+    for step in range(starting_entity, 9):
+        for entity in range(starting_entity, step + 1):
+            if y + entity > grid_height:
+                return tuple(blocks)
+            blocks.append((entity - 1, y, entity))
+        y += step
+    
+    while y < grid_height:
+        for entity in range(starting_entity, 9):
+            if y + entity > grid_height:
+                return tuple(blocks)
+            blocks.append((entity - 1, y, entity))
+        y += 8 - starting_entity + 1
+    return tuple(blocks)
+
+
+@lru_cache(maxsize=32)
+def _sona_full_sequence_layout(grid_height: int, starting_entity: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Rows of every entity from starting_entity, 8 beats apart."""
+    # No entity is taller than 8, so every row that starts 8 or more beats
+    # from the bottom fits entirely
+    row = [(entity - 1, entity) for entity in range(starting_entity, 9)]
+    blocks = [(x, y, entity) for y in range(0, grid_height // 8 * 8, 8) for x, entity in row]
+    
+    # Partial last row: the entities that still fit
+    y = grid_height // 8 * 8
+    if y < grid_height:
+        for x, entity in row:
+            if y + entity > grid_height:
+                break
+            blocks.append((x, y, entity))
+    return tuple(blocks)
+
+
+@lru_cache(maxsize=32)
+def _sona_rotations_layout(grid_height: int, base_sequence: Tuple[int, ...],
+                           rotation_count: int) -> Tuple[Tuple[int, int, int], ...]:
+    """One row per circular rotation of base_sequence, a beat apart."""
+    blocks = []
+    # Every rotation holds the same entities, so every row is as tall as
+    # the tallest of them
+    row_max_height = max(base_sequence)
+    y = 0
+    for rotation in range(rotation_count):
+        rotated = base_sequence[rotation:] + base_sequence[:rotation]
+        for pos in range(8):
+            entity = rotated[pos % len(rotated)]
+            if y + entity > grid_height:
+                return tuple(blocks)
+            blocks.append((pos, y, entity))
+        y += row_max_height + 1
+    return tuple(blocks)
+
+
+@lru_cache(maxsize=32)
+def _sona_palindrome_layout(grid_height: int, forward: Tuple[int, ...]) -> Tuple[Tuple[int, int, int], ...]:
+    """Alternating forward and reversed rows, a beat apart."""
+    blocks = []
+    reverse = forward[::-1]
+    # Forward and reverse rows share the same tallest entity
+    row_max_height = max(forward, default=0)
+    y = 0
+    toggle = True
+    while y < grid_height:
+        for pos, entity in enumerate(forward if toggle else reverse):
+            if y + entity > grid_height:
+                return tuple(blocks)
+            blocks.append((pos, y, entity))
+        y += row_max_height + 1
+        toggle = not toggle
+    return tuple(blocks)
+
+
+@lru_cache(maxsize=32)
+def _sona_canon_layout(grid_height: int, voices: int, offset_beats: int,
+                       starting_entity: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Sequential progressions repeated per voice, each offset down and across."""
+    blocks = []
+    for voice in range(voices):
+        y = voice * offset_beats
+        # First, build up the progression
+        for step in range(starting_entity, 9):
+            for entity in range(starting_entity, step + 1):
+                if y + entity > grid_height:
+                    break
+                # Shift x position by voice to create separation
+                blocks.append(((entity - 1 + voice) % 8, y, entity))
+            y += step
+            if y >= grid_height:
+                break
+        # Then continue with full sequence
+        while y < grid_height:
+            for entity in range(starting_entity, 9):
+                if y + entity > grid_height:
+                    break
+                blocks.append(((entity - 1 + voice) % 8, y, entity))
+            y += 8 - starting_entity + 1
+    return tuple(blocks)
+
+
+@lru_cache(maxsize=32)
+def _sona_fade_out_layout(grid_height: int, fade_steps: int,
+                          starting_entity: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Full rows that drop their lowest entity every fade_steps rows."""
+    blocks = []
+    y = 0
+    iteration = 0
+    current_start = starting_entity
+    while y < grid_height and current_start <= 8:
+        row_max_height = 0
+        for entity in range(current_start, 9):
+            if y + entity > grid_height:
+                return tuple(blocks)
+            blocks.append((entity - 1, y, entity))
+            row_max_height = max(row_max_height, entity)
+        
+        y += row_max_height + 1
+        iteration += 1
+        
+        # Every fade_steps iterations, remove an entity
+        if iteration % fade_steps == 0:
+            current_start += 1
+    return tuple(blocks)
+
+
+@lru_cache(maxsize=1)
+def _sona_shape_outlines():
+    """Closed unit-size outlines of the eight language shapes, indexed like the entities.
+    
+    Each entry is an (outlines, vertices, 2) array for a shape of size 1
+    centred on the origin, tracing the same path as its _draw_shape_* method.
+    """
+    def ring(count, radii):
+        # Closed polygon starting straight down, cycling through radii
+        pts = [(math.cos(math.pi * 2 / count * i - math.pi / 2) * radii[i % len(radii)],
+                math.sin(math.pi * 2 / count * i - math.pi / 2) * radii[i % len(radii)])
+               for i in range(count)]
+        return [pts + pts[:1]]
+    
+    def rect(x, y, w, h):
+        return [(x, y), (x + w, y), (x + w, y + h), (x, y + h), (x, y)]
+    
+    circle = [[(math.cos(2 * math.pi / 24 * i) * 0.5, math.sin(2 * math.pi / 24 * i) * 0.5)
+               for i in range(25)]]
+    outlines = (
+        [rect(-0.5, -0.5, 1, 1)],                                  # rect
+        [[(0, 0.5), (-0.5, -0.5), (0.5, -0.5), (0, 0.5)]],           # triangle
+        circle,                                                    # circle
+        [[(0, 0.5), (0.5, 0), (0, -0.5), (-0.5, 0), (0, 0.5)]],      # diamond
+        ring(6, (0.5,)),                                           # hexagon
+        ring(5, (0.5,)),                                           # pentagon
+        ring(10, (0.5, 0.2)),                                      # star
+        [rect(-1 / 6, -0.5, 1 / 3, 1), rect(-0.5, -1 / 6, 1, 1 / 3)],  # cross
+    )
+    return tuple(np.array(o, dtype=float) for o in outlines)
+
+
+@lru_cache(maxsize=64)
+def _hatch_direction(angle_deg: float) -> Tuple[float, float, float, float]:
+    """(cos, sin) of a hatch angle and of its perpendicular."""
+    angle_rad = math.radians(angle_deg)
+    return (math.cos(angle_rad), math.sin(angle_rad),
+            math.cos(angle_rad + math.pi / 2), math.sin(angle_rad + math.pi / 2))
+
+
+@lru_cache(maxsize=256)
+def _hatch_offsets(width: float, height: float, spacing: float):
+    """Diagonal of a hatch rectangle and the read-only perpendicular offsets of its lines."""
+    # Calculate the diagonal length needed to cover the rectangle
+    diagonal = math.hypot(width, height)
+    num_lines = int(diagonal / spacing) * 2
+    offset = np.arange(-num_lines, num_lines + 1) * spacing
+    
+    # Trivial reject: a line further than half the diagonal from the centre
+    # misses the rectangle at any angle, so most of the lines never need
+    # clipping. The extra spacing of slack keeps corner-grazing lines.
+    offset = offset[np.abs(offset) <= diagonal / 2 + spacing]
+    offset.flags.writeable = False
+    return diagonal, offset
+
+
+def _clip_segments_to_rect(x1, y1, x2, y2, min_x: float, min_y: float, max_x: float, max_y: float):
+    """Clip arrays of segments to a rectangle (Liang-Barsky, all segments at once).
+    
+    Returns the (x1, y1, x2, y2) arrays of the segments that touch the
+    rectangle, trimmed to it; segments entirely outside are dropped.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    t0 = np.zeros(len(x1))
+    t1 = np.ones(len(x1))
+    keep = np.ones(len(x1), dtype=bool)
+    
+    # Each edge constrains t along the segment: entering edges (p < 0) raise
+    # t0, leaving edges (p > 0) lower t1, and parallel segments (p == 0)
+    # outside the edge (q < 0) miss the rectangle
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p, q in ((-dx, x1 - min_x), (dx, max_x - x1),
+                     (-dy, y1 - min_y), (dy, max_y - y1)):
+            r = q / p
+            t0 = np.where(p < 0, np.maximum(t0, r), t0)
+            t1 = np.where(p > 0, np.minimum(t1, r), t1)
+            keep &= (p != 0) | (q >= 0)
+    keep &= t0 <= t1
+    
+    # Snap onto the rectangle so clipped ends land exactly on its edges
+    t0, t1 = t0[keep], t1[keep]
+    x1, y1, dx, dy = x1[keep], y1[keep], dx[keep], dy[keep]
+    return (np.clip(x1 + t0 * dx, min_x, max_x), np.clip(y1 + t0 * dy, min_y, max_y),
+            np.clip(x1 + t1 * dx, min_x, max_x), np.clip(y1 + t1 * dy, min_y, max_y))
+
+
+
+def _hatch_segments(x: float, y: float, width: float, height: float, angle_deg: float, spacing: float):
+    """Parallel hatching lines filling a rectangle, as clipped (x1, y1, x2, y2) arrays."""
+    # Entity and blend angles and cell sizes repeat cell after cell, so the
+    # trig and the line offsets are cached
+    cos_a, sin_a, perp_cos, perp_sin = _hatch_direction(angle_deg)
+    diagonal, offset = _hatch_offsets(width, height, spacing)
+    
+    # Generate lines perpendicular to the angle
+    center_x = x + width / 2
+    center_y = y + height / 2
+    
+    # Every line at once: offset by spacing perpendicular to the angle,
+    # running a diagonal each way along it
+    perp_x = perp_cos * offset
+    perp_y = perp_sin * offset
+    
+    start_x = center_x + perp_x - cos_a * diagonal
+    start_y = center_y + perp_y - sin_a * diagonal
+    end_x = center_x + perp_x + cos_a * diagonal
+    end_y = center_y + perp_y + sin_a * diagonal
+    
+    # Clip to rectangle bounds
+    return _clip_segments_to_rect(start_x, start_y, end_x, end_y, x, y, x + width, y + height)
+
+
+def _block_fill_path(x: float, y: float, width: float, height: float, fill_spacing: float):
+    """Outline and horizontal fill rows of a block as one pen-down polyline.
+    
+    Traces the rectangle, then runs the fill rows back and forth, stepping
+    between them along the side edges so the pen never lifts.
+    """
+    rows = np.arange(1, math.ceil(height / fill_spacing)) * fill_spacing
+    rows = y + rows[rows < height]
+    
+    # Even rows run left to right, odd rows right to left
+    left_first = np.arange(len(rows)) % 2 == 0
+    row_x = np.empty((len(rows), 2))
+    row_x[:, 0] = np.where(left_first, x, x + width)
+    row_x[:, 1] = np.where(left_first, x + width, x)
+    
+    xs = np.concatenate(((x, x + width, x + width, x, x), row_x.ravel()))
+    ys = np.concatenate(((y, y, y + height, y + height, y), np.repeat(rows, 2)))
+    return xs, ys
+
+
 class TurtleGenerator:
     """Generates patterns using turtle graphics."""
     
-    GENERATORS = {
+    GENERATORS = MappingProxyType({
         'spiral': {
             'name': 'Spiral',
             'description': 'Archimedean spiral',
@@ -92,7 +612,8 @@ class TurtleGenerator:
             'description': 'Random Voronoi diagram',
             'options': {
                 'points': {'type': 'int', 'default': 50, 'min': 10, 'max': 200},
-                'relax': {'type': 'int', 'default': 2, 'min': 0, 'max': 10}
+                'relax': {'type': 'int', 'default': 2, 'min': 0, 'max': 10},
+                'seed': {'type': 'int', 'default': -1, 'min': -1, 'max': 9999}
             }
         },
         'flowfield': {
@@ -101,7 +622,8 @@ class TurtleGenerator:
             'options': {
                 'lines': {'type': 'int', 'default': 200, 'min': 50, 'max': 1000},
                 'length': {'type': 'int', 'default': 50, 'min': 10, 'max': 200},
-                'scale': {'type': 'float', 'default': 0.01, 'min': 0.001, 'max': 0.1}
+                'scale': {'type': 'float', 'default': 0.01, 'min': 0.001, 'max': 0.1},
+                'seed': {'type': 'int', 'default': -1, 'min': -1, 'max': 9999}
             }
         },
         'border': {
@@ -461,10 +983,63 @@ class TurtleGenerator:
                 'max_checks': {'type': 'int', 'label': 'Max Checks to Draw', 'default': 500, 'min': 100, 'max': 2000}
             }
         }
-    }
+    })
+    
+    # list_generators() payload, built once: every entry tagged with its id
+    # and sorted by display name. The nested option dicts are shared, so
+    # callers only ever get deep copies.
+    _GENERATORS_SORTED = tuple(sorted(
+        ({'id': k, **v} for k, v in GENERATORS.items()),
+        key=lambda g: g['name'].lower()
+    ))
+    
+    # Unit-hexagon vertex directions (cos, sin) at 60 degree steps
+    _HEX_UNIT = tuple((math.cos(math.pi / 3 * i), math.sin(math.pi / 3 * i)) for i in range(6))
+    
+    # Generators whose output depends only on their options and the work
+    # area. Their fitted results are kept (up to _CACHE_SIZE) so switching
+    # back to a recent preset skips the work entirely.
+    _CACHEABLE = frozenset({
+        'spiral', 'spirograph', 'lissajous', 'hilbert', 'tree', 'dragon',
+        'hexagons', 'border', 'text', 'sonakinatography',
+    })
+    _CACHE_SIZE = 32
     
     def __init__(self, settings: PlotterSettings):
         self.settings = settings
+        self._cache: OrderedDict = OrderedDict()
+    
+    def _cache_key(self, generator: str, options: Dict[str, Any]):
+        """Cache key for a generate() call, or None if it can't be cached."""
+        if generator not in self._CACHEABLE:
+            return None
+        # 5, 5.0 and True hash and compare equal but can draw differently,
+        # so each value is keyed with its type. Unhashable values (lists
+        # from JSON) raise TypeError and bypass the cache.
+        try:
+            key = (generator,
+                   frozenset((k, type(v), v) for k, v in options.items()),
+                   frozenset(self.settings.get_work_area().items()))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _remember(self, cache_key, result):
+        """Keep a private copy of a generate() result under its cache key."""
+        if cache_key is None:
+            return
+        self._cache[cache_key] = self._copy_result(result)
+        if len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    @staticmethod
+    def _copy_result(result):
+        """Copy a Turtle or multi-layer result so callers can't mutate a cached one."""
+        if isinstance(result, dict):
+            return {**result, 'layers': [{**layer, 'turtle': layer['turtle'].copy()}
+                                         for layer in result.get('layers', [])]}
+        return result.copy()
     
     def _get_seed(self, options: Dict[str, Any], default: int = -1) -> int:
         """Get seed value from options. If -1, generate a truly random seed."""
@@ -476,31 +1051,31 @@ class TurtleGenerator:
     
     def list_generators(self) -> List[Dict]:
         """List available generators with their options, sorted alphabetically by name."""
-        generators = [
-            {'id': k, **v}
-            for k, v in self.GENERATORS.items()
-        ]
-        return sorted(generators, key=lambda g: g['name'].lower())
+        return copy.deepcopy(list(self._GENERATORS_SORTED))
     
     def generate(self, generator: str, options: Dict[str, Any] = None):
         """Generate a pattern. Returns Turtle or dict for multi-layer output."""
-        import sys
         options = options or {}
         
-        print(f"[TurtleGenerator] generate called: {generator}", file=sys.stderr, flush=True)
-        print(f"[TurtleGenerator] options: {options}", file=sys.stderr, flush=True)
+        logger.debug("generate called: %s", generator)
+        logger.debug("options: %s", options)
         
         generator_method = getattr(self, f'_generate_{generator}', None)
         if generator_method is None:
             raise ValueError(f"Unknown generator: {generator}")
         
+        cache_key = self._cache_key(generator, options)
+        if cache_key is not None and cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            return self._copy_result(self._cache[cache_key])
+        
         result = generator_method(options)
-        print(f"[TurtleGenerator] returned multiLayer={isinstance(result, dict) and result.get('multiLayer')}", file=sys.stderr, flush=True)
         
         # Check if result is multi-layer (Sonakinatography)
         if isinstance(result, dict) and result.get('multiLayer'):
             # Multi-layer results handle their own fitting
-            print(f"[TurtleGenerator] Multi-layer result with {len(result.get('layers', []))} layers", file=sys.stderr, flush=True)
+            logger.debug("multi-layer result with %d layers", len(result.get('layers', [])))
+            self._remember(cache_key, result)
             return result
         
         # Standard single turtle - fit to work area
@@ -513,78 +1088,62 @@ class TurtleGenerator:
             work_area['top'] - margin
         )
         
+        self._remember(cache_key, result)
         return result
     
+    def _render_parametric(self, x_of_t, y_of_t, period: float, steps: int, samples: int) -> Turtle:
+        """Draw a parametric curve as one polyline.
+        
+        t runs over `samples` points spaced period / steps apart from 0;
+        x_of_t and y_of_t take the whole t array.
+        """
+        turtle = Turtle()
+        t = period * np.arange(samples, dtype=np.float64) / steps
+        turtle.extend_polyline(x_of_t(t), y_of_t(t))
+        return turtle
+    
     def _generate_spiral(self, options: Dict[str, Any]) -> Turtle:
         """Generate an Archimedean spiral."""
-        turtle = Turtle()
-        
         turns = options.get('turns', 10)
         spacing = options.get('spacing', 5)
         
+        # Radius grows by `spacing` every turn
         steps_per_turn = 72
-        total_steps = int(turns * steps_per_turn)
-        
-        for i in range(total_steps):
-            angle = 2 * math.pi * i / steps_per_turn
-            r = spacing * i / steps_per_turn
-            
-            x = r * math.cos(angle)
-            y = r * math.sin(angle)
-            
-            if i == 0:
-                turtle.jump_to(x, y)
-            else:
-                turtle.move_to(x, y)
-        
-        return turtle
+        growth = spacing / (2 * np.pi)
+        return self._render_parametric(
+            lambda t: growth * t * np.cos(t),
+            lambda t: growth * t * np.sin(t),
+            2 * np.pi, steps_per_turn, int(turns * steps_per_turn)
+        )
     
     def _generate_spirograph(self, options: Dict[str, Any]) -> Turtle:
         """Generate a spirograph pattern (epitrochoid/hypotrochoid)."""
-        turtle = Turtle()
-        
         R = options.get('R', 100)  # Outer radius
         r = options.get('r', 60)   # Inner radius
         d = options.get('d', 80)   # Pen distance from center
         revolutions = options.get('revolutions', 10)
         
         steps = 1000 * revolutions
-        
-        for i in range(steps + 1):
-            t = 2 * math.pi * revolutions * i / steps
-            
-            x = (R - r) * math.cos(t) + d * math.cos((R - r) / r * t)
-            y = (R - r) * math.sin(t) - d * math.sin((R - r) / r * t)
-            
-            if i == 0:
-                turtle.jump_to(x, y)
-            else:
-                turtle.move_to(x, y)
-        
-        return turtle
+        pen_ratio = (R - r) / r
+        return self._render_parametric(
+            lambda t: (R - r) * np.cos(t) + d * np.cos(pen_ratio * t),
+            lambda t: (R - r) * np.sin(t) - d * np.sin(pen_ratio * t),
+            2 * np.pi * revolutions, steps, steps + 1
+        )
     
     def _generate_lissajous(self, options: Dict[str, Any]) -> Turtle:
         """Generate a Lissajous curve."""
-        turtle = Turtle()
-        
         a = options.get('a', 3)
         b = options.get('b', 4)
         delta = math.radians(options.get('delta', 90))
         size = options.get('size', 200)
         
         steps = 1000
-        
-        for i in range(steps + 1):
-            t = 2 * math.pi * i / steps
-            x = size * math.sin(a * t + delta)
-            y = size * math.sin(b * t)
-            
-            if i == 0:
-                turtle.jump_to(x, y)
-            else:
-                turtle.move_to(x, y)
-        
-        return turtle
+        return self._render_parametric(
+            lambda t: size * np.sin(a * t + delta),
+            lambda t: size * np.sin(b * t),
+            2 * np.pi, steps, steps + 1
+        )
     
     def _generate_maze(self, options: Dict[str, Any]) -> Turtle:
         """Generate a maze using recursive backtracking."""
@@ -594,65 +1153,72 @@ class TurtleGenerator:
         cols = options.get('cols', 20)
         cell_size = options.get('cell_size', 15)
         
-        # Initialize grid
-        visited = [[False] * cols for _ in range(rows)]
-        walls = {
-            'h': [[True] * cols for _ in range(rows + 1)],  # Horizontal walls
-            'v': [[True] * (cols + 1) for _ in range(rows)]  # Vertical walls
-        }
+        # Initialize grid as flat byte buffers. The visited grid has a border
+        # of already-visited cells so neighbour tests need no bounds checks.
+        stride = cols + 2
+        visited = bytearray(b'\x01') * ((rows + 2) * stride)
+        for row in range(rows):
+            start = (row + 1) * stride + 1
+            visited[start:start + cols] = bytes(cols)
+        walls_h = bytearray(b'\x01') * ((rows + 1) * cols)  # Horizontal walls
+        walls_v = bytearray(b'\x01') * (rows * (cols + 1))  # Vertical walls
+        
+        # (cell offset, direction) for up, down, left, right
+        moves = ((-stride, 0), (stride, 1), (-1, 2), (1, 3))
+        
+        # One random pick per carved cell, drawn up front in a single call. 12 is
+        # divisible by every possible neighbour count (1-4), so taking it
+        # modulo the count keeps each choice uniform.
+        picks = iter(random.choices(range(12), k=rows * cols))
         
         # Recursive backtracking
-        stack = [(0, 0)]
-        visited[0][0] = True
+        first = stride + 1
+        stack = [first]
+        visited[first] = 1
         
         while stack:
-            row, col = stack[-1]
-            neighbors = []
-            
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = row + dr, col + dc
-                if 0 <= nr < rows and 0 <= nc < cols and not visited[nr][nc]:
-                    neighbors.append((nr, nc, dr, dc))
+            cell = stack[-1]
+            neighbors = [move for move in moves if not visited[cell + move[0]]]
             
             if neighbors:
-                nr, nc, dr, dc = random.choice(neighbors)
+                step, direction = neighbors[next(picks) % len(neighbors)]
+                row, col = divmod(cell, stride)
+                row -= 1
+                col -= 1
                 
                 # Remove wall
-                if dr == -1:
-                    walls['h'][row][col] = False
-                elif dr == 1:
-                    walls['h'][row + 1][col] = False
-                elif dc == -1:
-                    walls['v'][row][col] = False
-                elif dc == 1:
-                    walls['v'][row][col + 1] = False
+                if direction == 0:
+                    walls_h[row * cols + col] = 0
+                elif direction == 1:
+                    walls_h[(row + 1) * cols + col] = 0
+                elif direction == 2:
+                    walls_v[row * (cols + 1) + col] = 0
+                else:
+                    walls_v[row * (cols + 1) + col + 1] = 0
                 
-                visited[nr][nc] = True
-                stack.append((nr, nc))
+                visited[cell + step] = 1
+                stack.append(cell + step)
             else:
                 stack.pop()
         
+        walls_h = np.frombuffer(walls_h, dtype=bool).reshape(rows + 1, cols)
+        walls_v = np.frombuffer(walls_v, dtype=bool).reshape(rows, cols + 1)
+        
         # Draw walls
         offset_x = -cols * cell_size / 2
         offset_y = -rows * cell_size / 2
         
-        # Horizontal walls
-        for row in range(rows + 1):
-            for col in range(cols):
-                if walls['h'][row][col]:
-                    x1 = offset_x + col * cell_size
-                    y1 = offset_y + row * cell_size
-                    x2 = x1 + cell_size
-                    turtle.draw_line(x1, y1, x2, y1)
+        # Horizontal walls (np.nonzero walks them in row-major order)
+        row, col = np.nonzero(walls_h)
+        x1 = offset_x + col * cell_size
+        y1 = offset_y + row * cell_size
+        turtle.draw_segments(x1, y1, x1 + cell_size, y1)
         
         # Vertical walls
-        for row in range(rows):
-            for col in range(cols + 1):
-                if walls['v'][row][col]:
-                    x1 = offset_x + col * cell_size
-                    y1 = offset_y + row * cell_size
-                    y2 = y1 + cell_size
-                    turtle.draw_line(x1, y1, x1, y2)
+        row, col = np.nonzero(walls_v)
+        x1 = offset_x + col * cell_size
+        y1 = offset_y + row * cell_size
+        turtle.draw_segments(x1, y1, x1, y1 + cell_size)
         
         return turtle
     
@@ -663,28 +1229,9 @@ class TurtleGenerator:
         iterations = options.get('iterations', 12)
         size = options.get('size', 3)
         
-        # Build L-system string
-        axiom = "FX"
-        rules = {'X': 'X+YF+', 'Y': '-FX-Y'}
-        
-        s = axiom
-        for _ in range(iterations):
-            ns = ""
-            for c in s:
-                ns += rules.get(c, c)
-            s = ns
-        
-        # Draw
-        turtle.jump_to(0, 0)
-        turtle.set_angle(0)
-        
-        for c in s:
-            if c == 'F':
-                turtle.forward(size)
-            elif c == '+':
-                turtle.turn_right(90)
-            elif c == '-':
-                turtle.turn_left(90)
+        # Starts at the origin heading east
+        gx, gy = _dragon_cells(iterations)
+        turtle.extend_polyline(gx * size, gy * size)
         
         return turtle
     
@@ -697,27 +1244,10 @@ class TurtleGenerator:
         
         step = size / (2 ** order - 1)
         
-        def hilbert(level, angle):
-            if level == 0:
-                return
-            
-            turtle.turn(-angle)
-            hilbert(level - 1, -angle)
-            turtle.forward(step)
-            turtle.turn(angle)
-            hilbert(level - 1, angle)
-            turtle.forward(step)
-            hilbert(level - 1, angle)
-            turtle.turn(angle)
-            turtle.forward(step)
-            hilbert(level - 1, -angle)
-            turtle.turn(-angle)
-        
-        # Start position
-        turtle.jump_to(-size/2, -size/2)
-        turtle.set_angle(0)
-        
-        hilbert(order, 90)
+        gx, gy = _hilbert_cells(order)
+        
+        # The turtle walk grew downward from its start corner, hence -gy
+        turtle.extend_polyline(-size/2 + gx * step, -size/2 - gy * step)
         
         return turtle
     
@@ -730,26 +1260,7 @@ class TurtleGenerator:
         angle = options.get('angle', 25)
         ratio = options.get('ratio', 0.7)
         
-        def branch(length, level):
-            if level == 0 or length < 2:
-                return
-            
-            turtle.forward(length)
-            
-            turtle.turn_left(angle)
-            branch(length * ratio, level - 1)
-            
-            turtle.turn_right(2 * angle)
-            branch(length * ratio, level - 1)
-            
-            turtle.turn_left(angle)
-            turtle.forward(-length)
-        
-        # Start at bottom center
-        turtle.jump_to(0, -200)
-        turtle.set_angle(90)
-        
-        branch(trunk_length, depth)
+        turtle.extend_polyline(*_tree_path(depth, trunk_length, angle, ratio))
         
         return turtle
     
@@ -768,29 +1279,23 @@ class TurtleGenerator:
         offset_x = -cols * w * 0.75 / 2
         offset_y = -rows * h / 2
         
-        for row in range(rows):
-            for col in range(cols):
-                cx = offset_x + col * w * 0.75
-                cy = offset_y + row * h + (h / 2 if col % 2 else 0)
-                
-                # Draw hexagon
-                for i in range(6):
-                    angle = math.pi / 3 * i
-                    x = cx + size * math.cos(angle)
-                    y = cy + size * math.sin(angle)
-                    
-                    if i == 0:
-                        turtle.jump_to(x, y)
-                    else:
-                        turtle.move_to(x, y)
-                
-                # Close hexagon
-                turtle.move_to(cx + size, cy)
+        # Centres of every cell in row-major order; odd columns sit half a
+        # cell higher
+        col = np.arange(cols)
+        cx = np.tile(offset_x + col * w * 0.75, rows)
+        cy = (offset_y + np.arange(rows)[:, None] * h + np.where(col % 2, h / 2, 0.0)).ravel()
+        
+        # Each hexagon is the shared unit outline (closed back to its first
+        # vertex) shifted to its centre
+        unit = self._HEX_UNIT + self._HEX_UNIT[:1]
+        vxs = np.array([size * ux for ux, _ in unit])
+        vys = np.array([size * uy for _, uy in unit])
+        turtle.draw_polylines(cx[:, None] + vxs, cy[:, None] + vys)
         
         return turtle
     
     def _generate_voronoi(self, options: Dict[str, Any]) -> Turtle:
-        """Generate a Voronoi diagram (simplified)."""
+        """Generate a Voronoi diagram, relaxed with Lloyd's algorithm."""
         turtle = Turtle()
         
         num_points = options.get('points', 50)
@@ -798,56 +1303,61 @@ class TurtleGenerator:
         
         work_area = self.settings.get_work_area()
         margin = 50
+        x0, x1 = work_area['left'] + margin, work_area['right'] - margin
+        y0, y1 = work_area['bottom'] + margin, work_area['top'] - margin
         
-        # Generate random points
-        points = [
-            (random.uniform(work_area['left'] + margin, work_area['right'] - margin),
-             random.uniform(work_area['bottom'] + margin, work_area['top'] - margin))
-            for _ in range(num_points)
-        ]
+        if num_points <= 0:
+            return turtle
         
-        # Simple relaxation (move toward centroid of nearest neighbors)
+        # Generate random points
+        rng = np.random.default_rng(self._get_seed(options))
+        sites = np.column_stack((rng.uniform(x0, x1, num_points),
+                                 rng.uniform(y0, y1, num_points)))
+        
+        def bounded_voronoi(sites):
+            # Mirroring the sites across each side of the box closes every
+            # original cell and clips it exactly to the box
+            px, py = sites[:, 0], sites[:, 1]
+            return Voronoi(np.vstack([
+                sites,
+                np.column_stack((2 * x0 - px, py)),
+                np.column_stack((2 * x1 - px, py)),
+                np.column_stack((px, 2 * y0 - py)),
+                np.column_stack((px, 2 * y1 - py)),
+            ]))
+        
+        n = len(sites)
+        
+        # Lloyd relaxation: move each site to the centroid of its cell, and
+        # stop early once no site moves by more than the plotter can resolve
         for _ in range(relax_iterations):
-            new_points = []
-            for px, py in points:
-                # Find nearby points
-                distances = sorted([
-                    (math.sqrt((px - qx)**2 + (py - qy)**2), qx, qy)
-                    for qx, qy in points if (qx, qy) != (px, py)
-                ])[:5]
-                
-                # Move toward average of midpoints
-                avg_x = px
-                avg_y = py
-                for _, qx, qy in distances:
-                    avg_x += (px + qx) / 2
-                    avg_y += (py + qy) / 2
-                avg_x /= len(distances) + 1
-                avg_y /= len(distances) + 1
-                
-                new_points.append((avg_x, avg_y))
-            points = new_points
-        
-        # Draw edges to nearest neighbors (simplified Voronoi)
-        for px, py in points:
-            distances = sorted([
-                (math.sqrt((px - qx)**2 + (py - qy)**2), qx, qy)
-                for qx, qy in points if (qx, qy) != (px, py)
-            ])[:3]
-            
-            for _, qx, qy in distances:
-                # Draw perpendicular bisector (simplified)
-                mx, my = (px + qx) / 2, (py + qy) / 2
-                dx, dy = qy - py, px - qx  # Perpendicular
-                length = math.sqrt(dx**2 + dy**2)
-                if length > 0:
-                    dx, dy = dx / length * 30, dy / length * 30
-                    turtle.draw_line(mx - dx, my - dy, mx + dx, my + dy)
+            vor = bounded_voronoi(sites)
+            previous = sites.copy()
+            for i in range(n):
+                cell = vor.vertices[vor.regions[vor.point_region[i]]]
+                x, y = cell[:, 0], cell[:, 1]
+                xn, yn = np.roll(x, -1), np.roll(y, -1)
+                cross = x * yn - xn * y
+                area = cross.sum() / 2
+                if area != 0:
+                    sites[i] = (((x + xn) * cross).sum() / (6 * area),
+                                ((y + yn) * cross).sum() / (6 * area))
+            if np.abs(sites - previous).max() < 0.01:
+                break
+        
+        # Draw the ridges shared by two original sites; ridges against the
+        # mirrored copies would only trace the bounding box
+        vor = bounded_voronoi(sites)
+        ridges = np.array(vor.ridge_vertices, dtype=np.intp).reshape(-1, 2)
+        keep = ((vor.ridge_points < n).all(axis=1) & (ridges >= 0).all(axis=1))
+        a = vor.vertices[ridges[keep, 0]]
+        b = vor.vertices[ridges[keep, 1]]
+        turtle.draw_segments(a[:, 0], a[:, 1], b[:, 0], b[:, 1])
         
         return turtle
     
     def _generate_flowfield(self, options: Dict[str, Any]) -> Turtle:
-        """Generate a flow field pattern using Perlin-like noise."""
+        """Generate a flow field pattern following simplex noise."""
         turtle = Turtle()
         
         num_lines = options.get('lines', 200)
@@ -857,29 +1367,43 @@ class TurtleGenerator:
         work_area = self.settings.get_work_area()
         margin = 50
         
-        # Simple noise function
-        def noise(x, y):
-            return math.sin(x * 0.1) * math.cos(y * 0.1) + \
-                   math.sin(x * 0.05 + y * 0.05) * 0.5
-        
-        for _ in range(num_lines):
-            x = random.uniform(work_area['left'] + margin, work_area['right'] - margin)
-            y = random.uniform(work_area['bottom'] + margin, work_area['top'] - margin)
+        left, right = work_area['left'], work_area['right']
+        bottom, top = work_area['bottom'], work_area['top']
+        
+        if num_lines <= 0:
+            return turtle
+        rng = np.random.default_rng(self._get_seed(options))
+        x = rng.uniform(left + margin, right - margin, num_lines)
+        y = rng.uniform(bottom + margin, top - margin, num_lines)
+        
+        # Advance every particle in lockstep, one vectorized step at a time.
+        # A particle stops (and keeps its point count) at its first step out
+        # of bounds; later steps still compute but are never emitted.
+        xs = np.empty((num_lines, line_length + 1))
+        ys = np.empty((num_lines, line_length + 1))
+        xs[:, 0] = x
+        ys[:, 0] = y
+        counts = np.full(num_lines, line_length + 1)
+        alive = np.ones(num_lines, dtype=bool)
+        
+        for step in range(1, line_length + 1):
+            angle = _simplex2d(x * scale, y * scale) * 2 * np.pi
             
-            turtle.jump_to(x, y)
+            x = x + np.cos(angle) * 3
+            y = y + np.sin(angle) * 3
             
-            for _ in range(line_length):
-                angle = noise(x * scale, y * scale) * 2 * math.pi
-                
-                x += math.cos(angle) * 3
-                y += math.sin(angle) * 3
-                
-                # Stay in bounds
-                if x < work_area['left'] or x > work_area['right'] or \
-                   y < work_area['bottom'] or y > work_area['top']:
-                    break
-                
-                turtle.move_to(x, y)
+            # Stay in bounds
+            out = (x < left) | (x > right) | (y < bottom) | (y > top)
+            counts[alive & out] = step
+            alive &= ~out
+            if not alive.any():
+                break
+            
+            xs[:, step] = x
+            ys[:, step] = y
+        
+        for i, n in enumerate(counts.tolist()):
+            turtle.extend_polyline(xs[i, :n], ys[i, :n])
         
         return turtle
     
@@ -906,76 +1430,22 @@ class TurtleGenerator:
         text = options.get('text', 'Hello World')
         size = options.get('size', 50)
         
-        # Single-stroke font - each letter defined as list of strokes
-        # Each stroke is a list of (x, y) points normalized to 0-1
-        FONT = {
-            'A': [[(0, 0), (0.5, 1), (1, 0)], [(0.2, 0.4), (0.8, 0.4)]],
-            'B': [[(0, 0), (0, 1), (0.7, 1), (0.8, 0.9), (0.8, 0.6), (0.7, 0.5), (0, 0.5)], 
-                  [(0.7, 0.5), (0.9, 0.4), (0.9, 0.1), (0.8, 0), (0, 0)]],
-            'C': [[(1, 0.2), (0.8, 0), (0.2, 0), (0, 0.2), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8)]],
-            'D': [[(0, 0), (0, 1), (0.6, 1), (0.9, 0.8), (1, 0.5), (0.9, 0.2), (0.6, 0), (0, 0)]],
-            'E': [[(1, 0), (0, 0), (0, 1), (1, 1)], [(0, 0.5), (0.7, 0.5)]],
-            'F': [[(0, 0), (0, 1), (1, 1)], [(0, 0.5), (0.7, 0.5)]],
-            'G': [[(1, 0.8), (0.8, 1), (0.2, 1), (0, 0.8), (0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 0.5), (0.5, 0.5)]],
-            'H': [[(0, 0), (0, 1)], [(1, 0), (1, 1)], [(0, 0.5), (1, 0.5)]],
-            'I': [[(0.3, 0), (0.7, 0)], [(0.5, 0), (0.5, 1)], [(0.3, 1), (0.7, 1)]],
-            'J': [[(0, 0.2), (0.2, 0), (0.6, 0), (0.8, 0.2), (0.8, 1)]],
-            'K': [[(0, 0), (0, 1)], [(1, 1), (0, 0.5), (1, 0)]],
-            'L': [[(0, 1), (0, 0), (1, 0)]],
-            'M': [[(0, 0), (0, 1), (0.5, 0.5), (1, 1), (1, 0)]],
-            'N': [[(0, 0), (0, 1), (1, 0), (1, 1)]],
-            'O': [[(0.2, 0), (0, 0.2), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.2), (0.8, 0), (0.2, 0)]],
-            'P': [[(0, 0), (0, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0.8, 0.5), (0, 0.5)]],
-            'Q': [[(0.2, 0), (0, 0.2), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.2), (0.8, 0), (0.2, 0)], [(0.6, 0.3), (1, 0)]],
-            'R': [[(0, 0), (0, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0.8, 0.5), (0, 0.5)], [(0.5, 0.5), (1, 0)]],
-            'S': [[(1, 0.8), (0.8, 1), (0.2, 1), (0, 0.8), (0, 0.6), (0.2, 0.5), (0.8, 0.5), (1, 0.4), (1, 0.2), (0.8, 0), (0.2, 0), (0, 0.2)]],
-            'T': [[(0, 1), (1, 1)], [(0.5, 1), (0.5, 0)]],
-            'U': [[(0, 1), (0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 1)]],
-            'V': [[(0, 1), (0.5, 0), (1, 1)]],
-            'W': [[(0, 1), (0.25, 0), (0.5, 0.5), (0.75, 0), (1, 1)]],
-            'X': [[(0, 0), (1, 1)], [(0, 1), (1, 0)]],
-            'Y': [[(0, 1), (0.5, 0.5), (1, 1)], [(0.5, 0.5), (0.5, 0)]],
-            'Z': [[(0, 1), (1, 1), (0, 0), (1, 0)]],
-            '0': [[(0.2, 0), (0, 0.2), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.2), (0.8, 0), (0.2, 0)], [(0.2, 0.2), (0.8, 0.8)]],
-            '1': [[(0.3, 0.8), (0.5, 1), (0.5, 0)], [(0.2, 0), (0.8, 0)]],
-            '2': [[(0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0, 0), (1, 0)]],
-            '3': [[(0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0.8, 0.5), (0.5, 0.5)], [(0.8, 0.5), (1, 0.4), (1, 0.2), (0.8, 0), (0.2, 0), (0, 0.2)]],
-            '4': [[(0.8, 0), (0.8, 1), (0, 0.3), (1, 0.3)]],
-            '5': [[(1, 1), (0, 1), (0, 0.5), (0.8, 0.5), (1, 0.4), (1, 0.2), (0.8, 0), (0.2, 0), (0, 0.2)]],
-            '6': [[(1, 0.8), (0.8, 1), (0.2, 1), (0, 0.8), (0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 0.4), (0.8, 0.5), (0, 0.5)]],
-            '7': [[(0, 1), (1, 1), (0.3, 0)]],
-            '8': [[(0.5, 0.5), (0.2, 0.5), (0, 0.7), (0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.7), (0.8, 0.5), (0.5, 0.5)], 
-                  [(0.5, 0.5), (0.2, 0.5), (0, 0.3), (0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 0.3), (0.8, 0.5)]],
-            '9': [[(0, 0.2), (0.2, 0), (0.8, 0), (1, 0.2), (1, 0.8), (0.8, 1), (0.2, 1), (0, 0.8), (0, 0.6), (0.2, 0.5), (1, 0.5)]],
-            '.': [[(0.4, 0.1), (0.6, 0.1), (0.6, 0), (0.4, 0), (0.4, 0.1)]],
-            ',': [[(0.5, 0.15), (0.5, 0), (0.3, -0.15)]],
-            '!': [[(0.5, 1), (0.5, 0.3)], [(0.5, 0.1), (0.5, 0)]],
-            '?': [[(0, 0.8), (0.2, 1), (0.8, 1), (1, 0.8), (1, 0.6), (0.5, 0.4), (0.5, 0.2)], [(0.5, 0.1), (0.5, 0)]],
-            '-': [[(0.2, 0.5), (0.8, 0.5)]],
-            ':': [[(0.5, 0.7), (0.5, 0.6)], [(0.5, 0.3), (0.5, 0.2)]],
-        }
-        
         # Calculate total width for centering
         letter_width = size * 0.7
         total_width = len(text) * letter_width
         x = -total_width / 2
         y = -size / 2
         
+        glyphs = _scaled_font(size)
         for char in text.upper():
             if char == ' ':
                 x += letter_width * 0.5
                 continue
             
-            strokes = FONT.get(char)
+            strokes = glyphs.get(char)
             if strokes:
-                for stroke in strokes:
-                    if len(stroke) >= 2:
-                        # First point - jump to it
-                        px, py = stroke[0]
-                        turtle.jump_to(x + px * size * 0.6, y + py * size)
-                        # Draw remaining points
-                        for px, py in stroke[1:]:
-                            turtle.move_to(x + px * size * 0.6, y + py * size)
+                for sx, sy in strokes:
+                    turtle.extend_polyline([x + px for px in sx], [y + py for py in sy])
             
             x += letter_width
         
@@ -988,8 +1458,6 @@ class TurtleGenerator:
     
     def _generate_slimemold(self, options: Dict[str, Any]) -> Turtle:
         """Generate a Physarum polycephalum (slime mold) simulation pattern."""
-        import numpy as np
-        
         turtle = Turtle()
         
         num_agents = int(options.get('agents', 2000))
@@ -1124,8 +1592,6 @@ class TurtleGenerator:
     def _trace_slime_contours(self, turtle: Turtle, trail_map, width: int, height: int, 
                                offset_x: float, offset_y: float):
         """Trace contour lines from the trail map."""
-        import numpy as np
-        
         contour_levels = [5, 15, 30, 50]
         grid_step = 4
         
@@ -3098,7 +3564,7 @@ class TurtleGenerator:
         height = work_area['top'] - work_area['bottom']
         center_x = work_area['left'] + width / 2
         center_y = work_area['bottom'] + height / 2
-        diagonal = math.sqrt(width * width + height * height)
+        diagonal = math.hypot(width, height)
         
         # Center offset radius (each layer's center rotates around the main center)
         center_offset_radius = min(width, height) * (center_offset_pct / 100)
@@ -3422,60 +3888,66 @@ class TurtleGenerator:
     # SONAKINATOGRAPHY SYSTEM - Channa Horwitz (1968-2013)
     # =========================================================================
     
+    # Sonakinatography algorithm name -> drawing call. Each entry reads and
+    # coerces only the options its algorithm uses.
+    _SONA_ALGORITHMS = {
+        'sequential_progression': lambda self, ctx, o, ts: self._sona_sequential_progression_multi(
+            ctx, int(o.get('starting_entity', 1)), ts),
+        'full_sequence': lambda self, ctx, o, ts: self._sona_full_sequence_multi(
+            ctx, int(o.get('starting_entity', 1)), ts),
+        'rotations': lambda self, ctx, o, ts: self._sona_rotations_multi(
+            ctx, int(o.get('rotation_count', 8)), ts),
+        'palindrome': lambda self, ctx, o, ts: self._sona_palindrome_multi(
+            ctx, int(o.get('starting_entity', 1)), ts),
+        'canon': lambda self, ctx, o, ts: self._sona_canon_multi(
+            ctx, int(o.get('voices', 3)), int(o.get('offset_beats', 8)),
+            int(o.get('starting_entity', 1)), ts),
+        'moire': lambda self, ctx, o, ts: self._sona_moire_multi(
+            ctx, ctx['grid_width'], int(o.get('entity_1', 3)), int(o.get('entity_2', 7))),
+        'fade_out': lambda self, ctx, o, ts: self._sona_fade_out_multi(
+            ctx, int(o.get('fade_steps', 4)), int(o.get('starting_entity', 1)), ts),
+        'language': lambda self, ctx, o, ts: self._sona_language_multi(
+            ctx, ctx['grid_width'], int(o.get('combination_size', 3))),
+        'inversion': lambda self, ctx, o, ts: self._sona_inversion_multi(
+            ctx, int(o.get('starting_entity', 1)), ts),
+        'cross_sections': lambda self, ctx, o, ts: self._sona_cross_sections_multi(
+            ctx, int(o.get('num_slices', 6)), ts),
+        'time_structure': lambda self, ctx, o, ts: self._sona_time_structure_multi(
+            ctx, int(o.get('num_instruments', 4)), ts),
+        'color_blend_grid': lambda self, ctx, o, ts: self._sona_color_blend_grid_multi(
+            ctx, int(o.get('blend_grid_size', 8)), float(o.get('hatch_density', 1.0))),
+        'prismatic_diagonal': lambda self, ctx, o, ts: self._sona_prismatic_diagonal_multi(
+            ctx, int(o.get('diagonal_width', 40)), ts),
+        'duration_lines': lambda self, ctx, o, ts: self._sona_duration_lines_multi(
+            ctx, int(o.get('num_duration_rows', 4)), ts),
+    }
+    
     def _generate_sonakinatography(self, options: Dict[str, Any]) -> Dict[str, Any]:
         """
         Sonakinatography generator - implements Channa Horwitz's rule-based notation system.
         Returns multi-layer output with each entity (1-8) as a separate color layer.
         """
-        import sys
         algorithm = options.get('algorithm', 'sequential_progression')
         cell_size = options.get('grid_cell_size', 15)
         grid_height = int(options.get('grid_height', 50))
         drawing_mode = options.get('drawing_mode', 'hatching')
         draw_grid = options.get('draw_grid', False)
-        starting_entity = int(options.get('starting_entity', 1))
-        rotation_count = int(options.get('rotation_count', 8))
-        voices = int(options.get('voices', 3))
-        offset_beats = int(options.get('offset_beats', 8))
-        entity_1 = int(options.get('entity_1', 3))
-        entity_2 = int(options.get('entity_2', 7))
-        fade_steps = int(options.get('fade_steps', 4))
-        combination_size = int(options.get('combination_size', 3))
-        num_slices = int(options.get('num_slices', 6))
         hatch_density = float(options.get('hatch_density', 1.0))
         source_text = options.get('source_text', '')
-        num_instruments = int(options.get('num_instruments', 4))
-        blend_grid_size = int(options.get('blend_grid_size', 8))
-        diagonal_width = int(options.get('diagonal_width', 40))
-        num_duration_rows = int(options.get('num_duration_rows', 4))
         
         # Convert source text to number sequence if provided
         text_sequence = self._text_to_sequence(source_text) if source_text.strip() else None
         
-        print(f"[SONA] algorithm={algorithm}, grid_height={grid_height}, drawing_mode={drawing_mode}", file=sys.stderr, flush=True)
-        print(f"[SONA] starting_entity={starting_entity}, rotation_count={rotation_count}, voices={voices}", file=sys.stderr, flush=True)
-        print(f"[SONA] offset_beats={offset_beats}, entity_1={entity_1}, entity_2={entity_2}", file=sys.stderr, flush=True)
-        print(f"[SONA] fade_steps={fade_steps}, num_slices={num_slices}, hatch_density={hatch_density}", file=sys.stderr, flush=True)
-        if text_sequence:
-            print(f"[SONA] text_sequence (first 20): {text_sequence[:20]}", file=sys.stderr, flush=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SONA] algorithm=%s, grid_height=%s, drawing_mode=%s", algorithm, grid_height, drawing_mode)
+            logger.debug("[SONA] hatch_density=%s, options=%s", hatch_density, options)
+            if text_sequence:
+                logger.debug("[SONA] text_sequence (first 20): %s", text_sequence[:20])
         
         grid_width = 8  # Fixed by Sonakinatography system
         palette = options.get('palette', 'rainbow')
         
-        # Define color palettes (using only available pen colors: brown, black, blue, green, purple, pink, red, orange, yellow)
-        PALETTES = {
-            'rainbow': ['brown', 'blue', 'green', 'purple', 'pink', 'red', 'orange', 'yellow'],
-            'monochrome': ['black', 'black', 'black', 'black', 'black', 'black', 'black', 'black'],
-            'primary': ['red', 'yellow', 'blue', 'red', 'yellow', 'blue', 'red', 'yellow'],
-            'warm': ['red', 'orange', 'yellow', 'pink', 'red', 'orange', 'yellow', 'pink'],
-            'cool': ['blue', 'green', 'purple', 'blue', 'green', 'purple', 'blue', 'green'],
-            'earth': ['brown', 'orange', 'green', 'brown', 'orange', 'green', 'brown', 'orange'],
-            'sunset': ['red', 'orange', 'yellow', 'pink', 'purple', 'red', 'orange', 'yellow'],
-            'ocean': ['blue', 'green', 'purple', 'blue', 'green', 'purple', 'blue', 'green']
-        }
-        
-        entity_colors = PALETTES.get(palette, PALETTES['rainbow'])
-        entity_names = ['Beat 1', 'Beat 2', 'Beat 3', 'Beat 4', 'Beat 5', 'Beat 6', 'Beat 7', 'Beat 8']
+        entity_colors = _SONA_PALETTES.get(palette, _SONA_PALETTES['rainbow'])
         
         # Create a turtle for each entity (1-8) plus grid
         entity_turtles = {i: Turtle() for i in range(1, 9)}
@@ -3489,11 +3961,7 @@ class TurtleGenerator:
         origin_x = -total_width / 2
         origin_y = -total_height / 2
         
-        # Hatching angles per entity (1-8) - more variety
-        entity_angles = [30, 50, 70, 90, 110, 130, 150, 170]
-        # Hatching spacing per entity - scaled by hatch_density
-        base_spacings = [0.6, 0.8, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0]
-        entity_spacings = [s / hatch_density for s in base_spacings]
+        entity_spacings = _sona_spacings(hatch_density)
         
         # Draw optional grid lines to grid turtle (black)
         if draw_grid:
@@ -3508,47 +3976,21 @@ class TurtleGenerator:
             'grid_height': grid_height,
             'grid_width': grid_width,
             'drawing_mode': drawing_mode,
-            'entity_angles': entity_angles,
+            'entity_angles': _SONA_ENTITY_ANGLES,
             'entity_spacings': entity_spacings
         }
         
         # Dispatch to specific algorithm (multi-layer versions)
         # If text_sequence is provided, use it to drive the algorithm where applicable
-        if algorithm == 'sequential_progression':
-            self._sona_sequential_progression_multi(ctx, starting_entity, text_sequence)
-        elif algorithm == 'full_sequence':
-            self._sona_full_sequence_multi(ctx, starting_entity, text_sequence)
-        elif algorithm == 'rotations':
-            self._sona_rotations_multi(ctx, rotation_count, text_sequence)
-        elif algorithm == 'palindrome':
-            self._sona_palindrome_multi(ctx, starting_entity, text_sequence)
-        elif algorithm == 'canon':
-            self._sona_canon_multi(ctx, voices, offset_beats, starting_entity, text_sequence)
-        elif algorithm == 'moire':
-            self._sona_moire_multi(ctx, grid_width, entity_1, entity_2)
-        elif algorithm == 'fade_out':
-            self._sona_fade_out_multi(ctx, fade_steps, starting_entity, text_sequence)
-        elif algorithm == 'language':
-            self._sona_language_multi(ctx, grid_width, combination_size)
-        elif algorithm == 'inversion':
-            self._sona_inversion_multi(ctx, starting_entity, text_sequence)
-        elif algorithm == 'cross_sections':
-            self._sona_cross_sections_multi(ctx, num_slices, text_sequence)
-        # New algorithms
-        elif algorithm == 'time_structure':
-            self._sona_time_structure_multi(ctx, num_instruments, text_sequence)
-        elif algorithm == 'color_blend_grid':
-            self._sona_color_blend_grid_multi(ctx, blend_grid_size, hatch_density)
-        elif algorithm == 'prismatic_diagonal':
-            self._sona_prismatic_diagonal_multi(ctx, diagonal_width, text_sequence)
-        elif algorithm == 'duration_lines':
-            self._sona_duration_lines_multi(ctx, num_duration_rows, text_sequence)
+        draw_algorithm = self._SONA_ALGORITHMS.get(algorithm)
+        if draw_algorithm is not None:
+            draw_algorithm(self, ctx, options, text_sequence)
         
         # Build layers array
         layers = []
         
         # Add grid layer first (if it has content)
-        if grid_turtle.get_lines():
+        if grid_turtle.has_content():
             # Fit grid to work area
             work_area = self.settings.get_work_area()
             margin = 20
@@ -3562,17 +4004,14 @@ class TurtleGenerator:
                 'turtle': grid_turtle
             })
         
-        # Calculate combined bounds for uniform scaling
-        all_points = []
-        for i in range(1, 9):
-            for line in entity_turtles[i].get_lines():
-                all_points.extend([(p.x, p.y) for p in line.points])
-        
-        if all_points:
-            min_x = min(p[0] for p in all_points)
-            max_x = max(p[0] for p in all_points)
-            min_y = min(p[1] for p in all_points)
-            max_y = max(p[1] for p in all_points)
+        # Calculate combined bounds for uniform scaling, reducing the raw
+        # coordinate buffers of every drawn line in one pass
+        coords = b''.join(line.coords for i in range(1, 9) for line in entity_turtles[i].get_lines())
+        
+        if coords:
+            xy = np.frombuffer(coords).reshape(-1, 2)
+            min_x, min_y = xy.min(axis=0).tolist()
+            max_x, max_y = xy.max(axis=0).tolist()
             
             work_area = self.settings.get_work_area()
             margin = 20
@@ -3593,17 +4032,18 @@ class TurtleGenerator:
                 target_cx = (target_left + target_right) / 2
                 target_cy = (target_bottom + target_top) / 2
                 
-                # Apply same transform to all entity turtles
+                # Apply same transform to all entity turtles, with the
+                # centering folded into the translation of a single pass
+                tx = target_cx - source_cx * scale
+                ty = target_cy - source_cy * scale
                 for i in range(1, 9):
-                    entity_turtles[i].translate(-source_cx, -source_cy)
-                    entity_turtles[i].scale(scale, scale)
-                    entity_turtles[i].translate(target_cx, target_cy)
+                    entity_turtles[i].affine(scale, scale, tx, ty)
         
         # Add entity layers
         for i in range(1, 9):
-            if entity_turtles[i].get_lines():
+            if entity_turtles[i].has_content():
                 layers.append({
-                    'name': entity_names[i - 1],
+                    'name': _SONA_ENTITY_NAMES[i - 1],
                     'color': entity_colors[i - 1],
                     'turtle': entity_turtles[i]
                 })
@@ -3617,6 +4057,12 @@ class TurtleGenerator:
         Uses letter position mod 8 + 1, filtering non-letters.
         A/a=1, B/b=2, ... H/h=8, I/i=1, etc.
         """
+        if text.isascii():
+            # ASCII letters are just byte ranges, so filter and map them in bulk
+            b = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+            letters = b[((b >= 65) & (b <= 90)) | ((b >= 97) & (b <= 122))]
+            return (((letters | 0x20) - 97) % 8 + 1).tolist()
+        
         sequence = []
         for char in text:
             if char.isalpha():
@@ -3632,41 +4078,18 @@ class TurtleGenerator:
         if text_sequence:
             self._sona_text_driven_pattern(ctx, text_sequence, 'sequential')
             return
-            
-        y = 0
-        # Build up from starting_entity
-        for step in range(starting_entity, 9):
-            for entity in range(starting_entity, step + 1):
-                if y + entity > ctx['grid_height']:
-                    return
-                x = entity - 1
-                self._draw_entity_block_multi(ctx, x, y, entity, entity)
-            y += step
         
-        # Continue with full sequence
-        while y < ctx['grid_height']:
-            for entity in range(starting_entity, 9):
-                if y + entity > ctx['grid_height']:
-                    return
-                x = entity - 1
-                self._draw_entity_block_multi(ctx, x, y, entity, entity)
-            y += 8 - starting_entity + 1
+        for x, y, entity in _sona_sequential_layout(ctx['grid_height'], starting_entity):
+            self._draw_entity_block_multi(ctx, x, y, entity, entity)
     
     def _sona_full_sequence_multi(self, ctx, starting_entity=1, text_sequence=None):
         """Full sequence repetition - repeating all entities vertically."""
         if text_sequence:
             self._sona_text_driven_pattern(ctx, text_sequence, 'full_sequence')
             return
-            
-        y = 0
-        while y < ctx['grid_height']:
-            for entity in range(starting_entity, 9):
-                if y + entity > ctx['grid_height']:
-                    return
-                x = entity - 1
-                self._draw_entity_block_multi(ctx, x, y, entity, entity)
-            # Advance by the height of the tallest entity in this row
-            y += 8
+        
+        for x, y, entity in _sona_full_sequence_layout(ctx['grid_height'], starting_entity):
+            self._draw_entity_block_multi(ctx, x, y, entity, entity)
     
     def _sona_rotations_multi(self, ctx, rotation_count=8, text_sequence=None):
         """Sequence rotations - circular permutations of the base sequence."""
@@ -3675,61 +4098,22 @@ class TurtleGenerator:
             base_sequence = text_sequence[:8] if len(text_sequence) >= 8 else text_sequence + [1] * (8 - len(text_sequence))
         else:
             base_sequence = [1, 2, 3, 4, 5, 6, 7, 8]
-        y = 0
-        for rotation in range(rotation_count):
-            rotated = base_sequence[rotation:] + base_sequence[:rotation]
-            row_max_height = 0
-            for pos in range(8):
-                entity = rotated[pos % len(rotated)]
-                if y + entity > ctx['grid_height']:
-                    return
-                self._draw_entity_block_multi(ctx, pos, y, entity, entity)
-                row_max_height = max(row_max_height, entity)
-            y += row_max_height + 1  # Add 1 beat gap between rotations
+        for x, y, entity in _sona_rotations_layout(ctx['grid_height'], tuple(base_sequence), rotation_count):
+            self._draw_entity_block_multi(ctx, x, y, entity, entity)
     
     def _sona_palindrome_multi(self, ctx, starting_entity=1, text_sequence=None):
         """Reversal palindrome - forward and reverse sequences."""
         if text_sequence:
             forward = text_sequence[:8]
         else:
-            forward = list(range(starting_entity, 9))
-        reverse = list(reversed(forward))
-        y = 0
-        toggle = True
-        while y < ctx['grid_height']:
-            sequence = forward if toggle else reverse
-            row_max_height = 0
-            for pos, entity in enumerate(sequence):
-                if y + entity > ctx['grid_height']:
-                    return
-                self._draw_entity_block_multi(ctx, pos, y, entity, entity)
-                row_max_height = max(row_max_height, entity)
-            y += row_max_height + 1
-            toggle = not toggle
+            forward = range(starting_entity, 9)
+        for x, y, entity in _sona_palindrome_layout(ctx['grid_height'], tuple(forward)):
+            self._draw_entity_block_multi(ctx, x, y, entity, entity)
     
     def _sona_canon_multi(self, ctx, voices, offset_beats, starting_entity=1, text_sequence=None):
         """Canon layering - multiple overlapping voices with offset starts."""
-        for voice in range(voices):
-            y = voice * offset_beats
-            # First, build up the progression
-            for step in range(starting_entity, 9):
-                for entity in range(starting_entity, step + 1):
-                    if y + entity > ctx['grid_height']:
-                        break
-                    # Shift x position by voice to create separation
-                    x = (entity - 1 + voice) % 8
-                    self._draw_entity_block_multi(ctx, x, y, entity, entity)
-                y += step
-                if y >= ctx['grid_height']:
-                    break
-            # Then continue with full sequence
-            while y < ctx['grid_height']:
-                for entity in range(starting_entity, 9):
-                    if y + entity > ctx['grid_height']:
-                        break
-                    x = (entity - 1 + voice) % 8
-                    self._draw_entity_block_multi(ctx, x, y, entity, entity)
-                y += 8 - starting_entity + 1
+        for x, y, entity in _sona_canon_layout(ctx['grid_height'], voices, offset_beats, starting_entity):
+            self._draw_entity_block_multi(ctx, x, y, entity, entity)
     
     def _sona_moire_multi(self, ctx, grid_width, entity_1, entity_2):
         """Moiré angle pairs - interference patterns from two line sets."""
@@ -3752,55 +4136,51 @@ class TurtleGenerator:
             # Use text sequence but fade out entities from it
             self._sona_text_driven_fade(ctx, text_sequence, fade_steps)
             return
-            
-        y = 0
-        iteration = 0
-        current_start = starting_entity
-        while y < ctx['grid_height'] and current_start <= 8:
-            # Draw current row
-            row_max_height = 0
-            for entity in range(current_start, 9):
-                if y + entity > ctx['grid_height']:
-                    return
-                x = entity - 1
-                self._draw_entity_block_multi(ctx, x, y, entity, entity)
-                row_max_height = max(row_max_height, entity)
-            
-            y += row_max_height + 1
-            iteration += 1
-            
-            # Every fade_steps iterations, remove an entity
-            if iteration % fade_steps == 0:
-                current_start += 1
+        
+        for x, y, entity in _sona_fade_out_layout(ctx['grid_height'], fade_steps, starting_entity):
+            self._draw_entity_block_multi(ctx, x, y, entity, entity)
     
     def _sona_language_multi(self, ctx, grid_width, combination_size):
-        from itertools import combinations
-        combos = list(combinations(range(8), combination_size))
+        # Empty or oversized combinations have no shapes to draw
+        if not 0 < combination_size <= 8:
+            return
+        
+        combos = np.array(list(combinations(range(8), combination_size)), dtype=np.intp)
         combos_per_row = grid_width
         shape_size = ctx['cell_size'] * 0.8
         
-        shape_funcs = [
-            self._draw_shape_rect,
-            self._draw_shape_triangle,
-            self._draw_shape_circle,
-            self._draw_shape_diamond,
-            self._draw_shape_hexagon,
-            self._draw_shape_pentagon,
-            self._draw_shape_star,
-            self._draw_shape_cross
-        ]
-        
-        for index, combo in enumerate(combos):
-            row = index // combos_per_row
-            col = index % combos_per_row
-            cx = ctx['origin_x'] + (col + 0.5) * ctx['cell_size'] * (grid_width / combos_per_row)
-            cy = ctx['origin_y'] + (row + 0.5) * ctx['cell_size'] * 2
-            if cy + shape_size > ctx['origin_y'] + ctx['grid_height'] * ctx['cell_size']:
-                return
-            for i, shape_idx in enumerate(combo):
-                offset_x = (i - (len(combo) - 1) / 2) * shape_size * 0.3
-                turtle = ctx['entity_turtles'][shape_idx + 1]
-                shape_funcs[shape_idx](turtle, cx + offset_x, cy, shape_size / len(combo))
+        # Lay out every combination at once; rows only move down, so the
+        # combinations that fit are a prefix of the list, ending just before
+        # the first one that overflows the grid
+        index = np.arange(len(combos))
+        row = index // combos_per_row
+        col = index % combos_per_row
+        cx = ctx['origin_x'] + (col + 0.5) * ctx['cell_size'] * (grid_width / combos_per_row)
+        cy = ctx['origin_y'] + (row + 0.5) * ctx['cell_size'] * 2
+        overflows = cy + shape_size > ctx['origin_y'] + ctx['grid_height'] * ctx['cell_size']
+        count = int(np.argmax(overflows)) if overflows.any() else len(combos)
+        
+        # Shapes within a combination are spread out side by side
+        offset_x = (np.arange(combination_size) - (combination_size - 1) / 2) * shape_size * 0.3
+        xs = cx[:count, None] + offset_x
+        size = shape_size / combination_size
+        
+        ys = np.broadcast_to(cy[:count, None], xs.shape)
+        
+        # Each shape index only ever goes to its own entity's turtle, so draw
+        # every copy of a shape in one go by scaling and shifting its unit
+        # outlines (row-major masking keeps the combination order)
+        shapes = combos[:count]
+        for shape_idx, outline in enumerate(_sona_shape_outlines()):
+            mask = shapes == shape_idx
+            if not mask.any():
+                continue
+            x = xs[mask][:, None, None]
+            y = ys[mask][:, None, None]
+            vertices = outline.shape[1]
+            ctx['entity_turtles'][shape_idx + 1].draw_polylines(
+                (x + outline[:, :, 0] * size).reshape(-1, vertices),
+                (y + outline[:, :, 1] * size).reshape(-1, vertices))
     
     def _sona_inversion_multi(self, ctx, starting_entity=1, text_sequence=None):
         """Numeric inversion - base and inverted (9-N) sequences side by side."""
@@ -3888,13 +4268,14 @@ class TurtleGenerator:
         cell_size = ctx['cell_size']
         track_width = (8 * cell_size) / num_instruments
         
-        # Draw vertical track lines (thin)
-        for inst in range(num_instruments):
-            x_center = ctx['origin_x'] + (inst + 0.5) * track_width
-            entity = (inst % 8) + 1
-            turtle = ctx['entity_turtles'][entity]
-            turtle.draw_line(x_center, ctx['origin_y'], 
-                           x_center, ctx['origin_y'] + ctx['grid_height'] * cell_size)
+        # Draw vertical track lines (thin), all of an entity's tracks at once
+        bottom = ctx['origin_y']
+        top = ctx['origin_y'] + ctx['grid_height'] * cell_size
+        for entity in range(1, 9):
+            inst = np.arange(entity - 1, num_instruments, 8)
+            if len(inst):
+                x_center = ctx['origin_x'] + (inst + 0.5) * track_width
+                ctx['entity_turtles'][entity].draw_segments(x_center, bottom, x_center, top)
         
         # Draw blocks at event positions
         for inst, entity, beat in events:
@@ -3912,6 +4293,14 @@ class TurtleGenerator:
         cell_size = ctx['cell_size']
         spacing = 1.5 / hatch_density
         
+        # Every cell is the same size, so each pass's hatching is computed once
+        # for a cell at the origin and then shifted into place: the first color
+        # at 45 degrees, the second color perpendicular at 135
+        passes = (np.array(_hatch_segments(0, 0, cell_size, cell_size, 45, spacing)),
+                  np.array(_hatch_segments(0, 0, cell_size, cell_size, 135, spacing)))
+        
+        # Collect each color's tiles in grid order, then emit them in one call
+        tiles = {entity: [] for entity in range(1, 9)}
         for row in range(grid_size):
             for col in range(grid_size):
                 # Each cell blends two colors based on position
@@ -3921,15 +4310,13 @@ class TurtleGenerator:
                 px = ctx['origin_x'] + col * cell_size
                 py = ctx['origin_y'] + row * cell_size
                 
-                # Draw hatching in first color at one angle
-                angle1 = 45
-                self._draw_hatching(ctx['entity_turtles'][color1], 
-                                  px, py, cell_size, cell_size, angle1, spacing)
-                
-                # Draw hatching in second color at perpendicular angle
-                angle2 = 135
-                self._draw_hatching(ctx['entity_turtles'][color2], 
-                                  px, py, cell_size, cell_size, angle2, spacing)
+                shift = np.array([[px], [py], [px], [py]])
+                tiles[color1].append(passes[0] + shift)
+                tiles[color2].append(passes[1] + shift)
+        
+        for entity, segments in tiles.items():
+            if segments:
+                ctx['entity_turtles'][entity].draw_segments(*np.hstack(segments))
     
     def _sona_prismatic_diagonal_multi(self, ctx, diagonal_width=40, text_sequence=None):
         """
@@ -3946,36 +4333,41 @@ class TurtleGenerator:
         # Number of diagonal stripes to fill the space
         num_stripes = int((total_width + total_height) / stripe_width) + 1
         
-        for stripe_idx in range(num_stripes):
-            # Determine entity/color based on stripe position
-            if text_sequence:
-                entity = text_sequence[stripe_idx % len(text_sequence)]
-            else:
-                entity = (stripe_idx % 8) + 1
-            
-            turtle = ctx['entity_turtles'][entity]
-            
-            # Calculate diagonal line positions (top-left to bottom-right)
-            offset = stripe_idx * stripe_width - total_height
-            
-            # Draw diagonal stripe as series of parallel lines
-            for sub in range(int(stripe_width / 2)):
-                x1 = ctx['origin_x'] + offset + sub
-                y1 = ctx['origin_y'] + total_height
-                x2 = ctx['origin_x'] + offset + total_height + sub
-                y2 = ctx['origin_y']
-                
-                # Clip to bounds
-                if x1 < ctx['origin_x']:
-                    y1 = y1 - (ctx['origin_x'] - x1)
-                    x1 = ctx['origin_x']
-                if x2 > ctx['origin_x'] + total_width:
-                    y2 = y2 + (x2 - (ctx['origin_x'] + total_width))
-                    x2 = ctx['origin_x'] + total_width
-                
-                if x1 < ctx['origin_x'] + total_width and x2 > ctx['origin_x']:
-                    if y1 > ctx['origin_y'] and y2 < ctx['origin_y'] + total_height:
-                        turtle.draw_line(x1, y1, x2, y2)
+        # Determine entity/color based on stripe position
+        stripe_idx = np.arange(num_stripes)
+        if text_sequence:
+            entity = np.asarray(text_sequence)[stripe_idx % len(text_sequence)]
+        else:
+            entity = (stripe_idx % 8) + 1
+        
+        # Every parallel line of every stripe at once, one row per stripe.
+        # Diagonal line positions run top-left to bottom-right.
+        offset = (stripe_idx * stripe_width - total_height)[:, None]
+        sub = np.arange(int(stripe_width / 2))[None, :]
+        origin_x = ctx['origin_x']
+        origin_y = ctx['origin_y']
+        x1 = origin_x + offset + sub
+        y1 = np.full(x1.shape, origin_y + total_height)
+        x2 = origin_x + offset + total_height + sub
+        y2 = np.full(x2.shape, origin_y)
+        
+        # Clip to bounds
+        left = x1 < origin_x
+        y1[left] -= origin_x - x1[left]
+        x1[left] = origin_x
+        right = x2 > origin_x + total_width
+        y2[right] += x2[right] - (origin_x + total_width)
+        x2[right] = origin_x + total_width
+        
+        keep = ((x1 < origin_x + total_width) & (x2 > origin_x) &
+                (y1 > origin_y) & (y2 < origin_y + total_height))
+        
+        # Row-major masking keeps each turtle's lines in stripe order
+        entity = np.broadcast_to(entity[:, None], keep.shape)
+        for e in range(1, 9):
+            mask = keep & (entity == e)
+            if mask.any():
+                ctx['entity_turtles'][e].draw_segments(x1[mask], y1[mask], x2[mask], y2[mask])
     
     def _sona_duration_lines_multi(self, ctx, num_rows=4, text_sequence=None):
         """
@@ -4075,12 +4467,7 @@ class TurtleGenerator:
             cx = px + width / 2
             turtle.draw_line(cx, py, cx, py + height)
         elif ctx['drawing_mode'] == 'blocks':
-            turtle.draw_rect(px, py, width, height)
-            fill_spacing = 1.5
-            fy = fill_spacing
-            while fy < height:
-                turtle.draw_line(px, py + fy, px + width, py + fy)
-                fy += fill_spacing
+            turtle.extend_polyline(*_block_fill_path(px, py, width, height, 1.5))
         else:
             # Hatching mode
             angle = ctx['entity_angles'][entity - 1]
@@ -4090,14 +4477,15 @@ class TurtleGenerator:
     def _draw_sona_grid(self, turtle: Turtle, origin_x: float, origin_y: float, 
                         grid_width: int, grid_height: int, cell_size: float):
         """Draw the underlying grid structure."""
-        # Vertical lines
-        for x in range(grid_width + 1):
-            px = origin_x + x * cell_size
-            turtle.draw_line(px, origin_y, px, origin_y + grid_height * cell_size)
-        # Horizontal lines
-        for y in range(grid_height + 1):
-            py = origin_y + y * cell_size
-            turtle.draw_line(origin_x, py, origin_x + grid_width * cell_size, py)
+        # Vertical lines, then horizontal lines, in one batch
+        px = origin_x + np.arange(grid_width + 1) * cell_size
+        py = origin_y + np.arange(grid_height + 1) * cell_size
+        top = np.full_like(px, origin_y + grid_height * cell_size)
+        right = np.full_like(py, origin_x + grid_width * cell_size)
+        turtle.draw_segments(np.concatenate((px, np.full_like(py, origin_x))),
+                             np.concatenate((np.full_like(px, origin_y), py)),
+                             np.concatenate((px, right)),
+                             np.concatenate((top, py)))
     
     def _draw_entity_block(self, turtle: Turtle, origin_x: float, origin_y: float, 
                            cell_size: float, x: int, y: int, duration: int, entity: int,
@@ -4113,14 +4501,8 @@ class TurtleGenerator:
             cx = px + width / 2
             turtle.draw_line(cx, py, cx, py + height)
         elif mode == 'blocks':
-            # Draw filled rectangle outline
-            turtle.draw_rect(px, py, width, height)
-            # Add internal fill lines
-            fill_spacing = 1.5
-            fy = fill_spacing
-            while fy < height:
-                turtle.draw_line(px, py + fy, px + width, py + fy)
-                fy += fill_spacing
+            # Rectangle outline and internal fill lines in one stroke
+            turtle.extend_polyline(*_block_fill_path(px, py, width, height, 1.5))
         else:
             # Hatching mode (default)
             angle = angles[entity - 1]
@@ -4130,83 +4512,7 @@ class TurtleGenerator:
     def _draw_hatching(self, turtle: Turtle, x: float, y: float, 
                        width: float, height: float, angle_deg: float, spacing: float):
         """Fill a rectangle with parallel hatching lines."""
-        angle_rad = math.radians(angle_deg)
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        
-        # Calculate the diagonal length needed to cover the rectangle
-        diagonal = math.sqrt(width * width + height * height)
-        num_lines = int(diagonal / spacing) * 2
-        
-        # Generate lines perpendicular to the angle
-        center_x = x + width / 2
-        center_y = y + height / 2
-        
-        for i in range(-num_lines, num_lines + 1):
-            offset = i * spacing
-            
-            # Line perpendicular to angle, offset by spacing
-            perp_x = math.cos(angle_rad + math.pi / 2) * offset
-            perp_y = math.sin(angle_rad + math.pi / 2) * offset
-            
-            # Start and end points along the angle direction
-            start_x = center_x + perp_x - cos_a * diagonal
-            start_y = center_y + perp_y - sin_a * diagonal
-            end_x = center_x + perp_x + cos_a * diagonal
-            end_y = center_y + perp_y + sin_a * diagonal
-            
-            # Clip to rectangle bounds
-            clipped = self._clip_line_to_rect(start_x, start_y, end_x, end_y, x, y, x + width, y + height)
-            if clipped:
-                turtle.draw_line(clipped[0], clipped[1], clipped[2], clipped[3])
-    
-    def _clip_line_to_rect(self, x1: float, y1: float, x2: float, y2: float,
-                           min_x: float, min_y: float, max_x: float, max_y: float):
-        """Clip a line to a rectangle using Cohen-Sutherland algorithm."""
-        INSIDE, LEFT, RIGHT, BOTTOM, TOP = 0, 1, 2, 4, 8
-        
-        def compute_code(x, y):
-            code = INSIDE
-            if x < min_x:
-                code |= LEFT
-            elif x > max_x:
-                code |= RIGHT
-            if y < min_y:
-                code |= BOTTOM
-            elif y > max_y:
-                code |= TOP
-            return code
-        
-        code1 = compute_code(x1, y1)
-        code2 = compute_code(x2, y2)
-        
-        while True:
-            if not (code1 | code2):
-                return (x1, y1, x2, y2)
-            elif code1 & code2:
-                return None
-            else:
-                code_out = code1 if code1 else code2
-                
-                if code_out & TOP:
-                    x = x1 + (x2 - x1) * (max_y - y1) / (y2 - y1) if y2 != y1 else x1
-                    y = max_y
-                elif code_out & BOTTOM:
-                    x = x1 + (x2 - x1) * (min_y - y1) / (y2 - y1) if y2 != y1 else x1
-                    y = min_y
-                elif code_out & RIGHT:
-                    y = y1 + (y2 - y1) * (max_x - x1) / (x2 - x1) if x2 != x1 else y1
-                    x = max_x
-                else:
-                    y = y1 + (y2 - y1) * (min_x - x1) / (x2 - x1) if x2 != x1 else y1
-                    x = min_x
-                
-                if code_out == code1:
-                    x1, y1 = x, y
-                    code1 = compute_code(x1, y1)
-                else:
-                    x2, y2 = x, y
-                    code2 = compute_code(x2, y2)
+        turtle.draw_segments(*_hatch_segments(x, y, width, height, angle_deg, spacing))
     
     # Algorithm 1: Sequential Progression
     def _sona_sequential_progression(self, turtle: Turtle, origin_x: float, origin_y: float,
@@ -4332,30 +4638,7 @@ class TurtleGenerator:
     def _draw_parallel_lines(self, turtle: Turtle, x: float, y: float,
                              width: float, height: float, angle_deg: float, spacing: float):
         """Draw parallel lines across a rectangle at a given angle."""
-        angle_rad = math.radians(angle_deg)
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        
-        diagonal = math.sqrt(width * width + height * height)
-        num_lines = int(diagonal / spacing) * 2
-        
-        center_x = x + width / 2
-        center_y = y + height / 2
-        
-        for i in range(-num_lines, num_lines + 1):
-            offset = i * spacing
-            
-            perp_x = math.cos(angle_rad + math.pi / 2) * offset
-            perp_y = math.sin(angle_rad + math.pi / 2) * offset
-            
-            start_x = center_x + perp_x - cos_a * diagonal
-            start_y = center_y + perp_y - sin_a * diagonal
-            end_x = center_x + perp_x + cos_a * diagonal
-            end_y = center_y + perp_y + sin_a * diagonal
-            
-            clipped = self._clip_line_to_rect(start_x, start_y, end_x, end_y, x, y, x + width, y + height)
-            if clipped:
-                turtle.draw_line(clipped[0], clipped[1], clipped[2], clipped[3])
+        self._draw_hatching(turtle, x, y, width, height, angle_deg, spacing)
     
     # Algorithm 7: Fade Out Sequence
     def _sona_fade_out(self, turtle: Turtle, origin_x: float, origin_y: float,
@@ -4388,8 +4671,6 @@ class TurtleGenerator:
     # Algorithm 8: Language Combinations
     def _sona_language(self, turtle: Turtle, origin_x: float, origin_y: float,
                        cell_size: float, grid_width: int, grid_height: int, combination_size: int):
-        from itertools import combinations
-        
         shape_funcs = [
             self._draw_shape_rect,
             self._draw_shape_triangle,